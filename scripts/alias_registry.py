@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+
+from fetch_cache import CACHE_ROOT
+
+DEFAULT_ALIAS_PATH = os.path.join(CACHE_ROOT, "aliases.json")
+
+
+class AliasRegistry:
+    """
+    Persistent raw name -> canonical team map shared by every build.
+
+    The JSON file has three sections:
+    pins       raw name -> canonical, edited by hand, always wins
+    overrides  canonical -> name to show instead, edited by hand
+    aliases    raw name -> canonical, learned from fuzzy matching
+
+    Names seen before resolve with a dict lookup; only new names are fuzzy matched,
+    and existing canonical names never change because the frequency order shifted.
+    """
+
+    def __init__(self, path=DEFAULT_ALIAS_PATH):
+        self.path = path
+        self.pins = {}
+        self.overrides = {}
+        self.aliases = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.pins = data.get("pins", {})
+            self.overrides = data.get("overrides", {})
+            self.aliases = data.get("aliases", {})
+        except (OSError, ValueError):
+            pass
+        self._pinned_canonicals = set(self.pins.values())
+
+    def resolve(self, raw):
+        """
+        Canonical team for a raw name, or None if the name is new
+        """
+        if raw in self.pins:
+            return self.pins[raw]
+        if raw in self.aliases:
+            return self.pinned(self.aliases[raw])
+        if raw in self._pinned_canonicals:
+            return raw
+        return None
+
+    def pinned(self, canonical):
+        """
+        Team a learned canonical has been pinned to since, so a pin on one raw
+        name carries over to every alias learned for it; the canonical otherwise
+        """
+        return self.pins.get(canonical, canonical)
+
+    def display_name(self, canonical):
+        return self.overrides.get(canonical, canonical)
+
+    def canonical_names(self):
+        """
+        Every known canonical, pinned ones first, in a stable order
+        """
+        names = dict.fromkeys(sorted(self._pinned_canonicals))
+        names.update(dict.fromkeys(sorted(set(self.aliases.values()))))
+        return list(names)
+
+    def learn(self, mapping):
+        for raw, canonical in mapping.items():
+            if raw not in self.pins:
+                self.aliases[raw] = canonical
+            self.aliases.setdefault(canonical, canonical)
+
+    def pin(self, raw, canonical):
+        self.pins[raw] = canonical
+        self._pinned_canonicals.add(canonical)
+
+    def override(self, canonical, display_name):
+        self.overrides[canonical] = display_name
+
+    def fingerprint(self):
+        """
+        Digest of the hand-edited entries, which change results without any source changing
+        """
+        manual = json.dumps([self.pins, self.overrides], sort_keys=True)
+        return hashlib.sha256(manual.encode("utf-8")).hexdigest()
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"pins": self.pins, "overrides": self.overrides, "aliases": self.aliases},
+                      f, indent=1, sort_keys=True, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
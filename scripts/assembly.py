@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from board import DEFAULT_ROUND_SLOTS, round_columns
+
+
+def _narrow_int(matrix):
+    """
+    Smallest integer dtype that holds every value of matrix
+    """
+    if matrix.size == 0:
+        return matrix.astype(np.int8)
+    low, high = int(matrix.min()), int(matrix.max())
+    # Signed, so negative scores and deltas behave
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return matrix.astype(dtype)
+    return matrix.astype(np.int64)
+
+
+def assemble_leaderboard(rounds, round_slots=DEFAULT_ROUND_SLOTS):
+    """
+    Build the team x round score matrix in one pass.
+
+    rounds: list of (round_num, round_name, teams, scores) with normalized team names
+    Team names are interned to integer ids (sorted by name), every (team_id, column, score)
+    row is summed straight into the matrix, so duplicate rows within a round add up.
+    Returns (teams, columns, matrix) with matrix as a narrow signed int array.
+    """
+    columns, column_of = round_columns([r[0] for r in rounds], [r[1] for r in rounds], round_slots)
+
+    all_teams = np.concatenate([np.asarray(r[2], dtype=object) for r in rounds]) if rounds else np.array([], dtype=object)
+    team_ids, teams = pd.factorize(all_teams, sort=True)
+
+    lengths = [len(r[2]) for r in rounds]
+    column_ids = np.repeat(np.asarray(column_of, dtype=np.int64), lengths)
+    scores = np.concatenate([np.asarray(r[3], dtype=np.float64) for r in rounds]) if rounds else np.array([])
+
+    # Rounds whose slot is not on the board still contribute their teams, but no scores
+    shown = column_ids >= 0
+    flat = team_ids[shown] * len(columns) + column_ids[shown]
+    sums = np.bincount(flat, weights=scores[shown], minlength=len(teams) * len(columns))
+    matrix = sums.reshape(len(teams), len(columns))
+
+    # Same truncation as DataFrame.astype(int) on the summed scores
+    matrix = _narrow_int(np.trunc(matrix).astype(np.int64))
+    return list(teams), columns, matrix
+
+
+def leaderboard_frame(teams, columns, matrix):
+    """
+    DataFrame view of an assembled board: Team, one column per round, Total
+    """
+    df = pd.DataFrame(matrix, columns=columns)
+    df.insert(0, "Team", teams)
+    df["Total"] = matrix.sum(axis=1, dtype=np.int64)
+    return df
+
+
+def board_frame(board):
+    """
+    DataFrame view of a Board, with a Position column once it is ranked
+    """
+    matrix = np.array([col.tolist() for col in board.scores], dtype=np.int64).T.reshape(len(board), len(board.columns))
+    df = leaderboard_frame(board.teams, board.columns, _narrow_int(matrix))
+    if board.positions is not None:
+        df["Position"] = board.positions.tolist()
+    return df
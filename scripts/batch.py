@@ -0,0 +1,164 @@
+import argparse
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from alias_registry import AliasRegistry
+from fetch_cache import FetchCache, DEFAULT_CACHE_DIR
+from leaderboard_gen import generate_leaderboard
+from metrics import metrics
+from newscraper import expand_rounds, extract_round, fetch_round_sources, parse_document, round_source
+
+logger = logging.getLogger(__name__)
+
+
+def load_boards(path):
+    """
+    Board definitions from a JSON file:
+
+    {"boards": [{"name": "erc2025", "output": "site/index.html",
+                 "rounds": [[1, "Qualification", "https://...", "Team name", "Sum"], ...],
+                 "page_size": null, "export": false, "aliases": null}, ...]}
+
+    A round may also name a table, [1, "Qualification", url, "Team name", "Sum", 2]
+    (see read_table), and several rounds of one document can be grouped as
+    [url, [[6, "Report", "Team", "Challenge 2"], [9, "Report 1", "Team", "Challenge 1"]]].
+    Only name, output and rounds are required. Relative output/aliases paths
+    are taken relative to the config file.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+    boards = []
+    for board in data["boards"]:
+        for key in ("name", "output", "rounds"):
+            if key not in board:
+                raise ValueError(f"Board {board.get('name', len(boards) + 1)!r} in {path} has no {key!r}")
+        boards.append({
+            "name": board["name"],
+            "output": os.path.join(base, board["output"]),
+            "rounds": expand_rounds(board["rounds"]),
+            "page_size": board.get("page_size"),
+            "export": board.get("export", False),
+            "aliases": os.path.join(base, board["aliases"]) if board.get("aliases") else None,
+        })
+    outputs = [board["output"] for board in boards]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError(f"Two boards in {path} write to the same output")
+    return boards
+
+
+def prepare_sources(boards, cache=None, max_workers=8):
+    """
+    Fetch and parse every unique URL once, then read every unique round_source() from it.
+    Returns ({url: (md_text, error)}, {(url, team_col, score_col, table): (teams, scores) or None})
+    """
+    unique_urls = {}
+    for board in boards:
+        for round_cfg in board["rounds"]:
+            unique_urls.setdefault(round_cfg[2], round_cfg)
+    fetched = fetch_round_sources(list(unique_urls.values()), max_workers=max_workers, cache=cache)
+    sources = dict(zip(unique_urls, fetched))
+
+    documents = {}
+    tables = {}
+    for board in boards:
+        for round_cfg in board["rounds"]:
+            key = round_source(round_cfg)
+            url = key[0]
+            md_text, error = sources[url]
+            if error is None and key not in tables:
+                if url not in documents:
+                    documents[url] = parse_document(md_text)
+                tables[key] = extract_round(documents[url], round_cfg[1], *key[1:])
+    logger.info("%d boards share %d sources and %d tables", len(boards), len(sources), len(tables))
+    return sources, tables
+
+
+def _init_worker(level):
+    logging.basicConfig(format="%(message)s", level=level)
+
+
+def build_board(board, sources, tables):
+    """
+    Normalize, assemble and render one board from already fetched and parsed rounds.
+    Runs in a worker process; returns (name, metrics snapshot).
+    """
+    # A reused or forked worker still holds counts from earlier work
+    metrics.reset()
+    registry = AliasRegistry(board["aliases"]) if board["aliases"] else None
+    os.makedirs(os.path.dirname(board["output"]) or ".", exist_ok=True)
+    generate_leaderboard(board["rounds"], registry=registry, output_path=board["output"],
+                         page_size=board["page_size"], export=board["export"],
+                         sources=sources, tables=tables)
+    return board["name"], metrics.snapshot()
+
+
+def build_all(boards, cache=None, workers=None):
+    """
+    Build every board: shared fetch + parse here, then one worker process per board.
+    Returns the names of the boards that failed.
+    """
+    with metrics.stage("batch"):
+        sources, tables = prepare_sources(boards, cache=cache)
+        jobs = []
+        for board in boards:
+            keys = {round_source(round_cfg) for round_cfg in board["rounds"]}
+            jobs.append((board,
+                         [sources[round_cfg[2]] for round_cfg in board["rounds"]],
+                         {key: tables[key] for key in keys if key in tables}))
+
+        failed = []
+        snapshots = []
+        # build_board resets the counters of the process it runs in
+        parent = metrics.snapshot()
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(boards) == 1:
+            for job in jobs:
+                try:
+                    snapshots.append(build_board(*job)[1])
+                except Exception as e:
+                    logger.error("Board %s failed: %s", job[0]["name"], e)
+                    failed.append(job[0]["name"])
+            metrics.reset()
+            metrics.merge(parent)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(logging.getLogger().level,)) as pool:
+                futures = [(job[0]["name"], pool.submit(build_board, *job)) for job in jobs]
+                for name, future in futures:
+                    try:
+                        snapshots.append(future.result()[1])
+                    except Exception as e:
+                        logger.error("Board %s failed: %s", name, e)
+                        failed.append(name)
+        for snapshot in snapshots:
+            metrics.merge(snapshot)
+        metrics.count("boards_built", len(boards) - len(failed))
+    return failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build several leaderboards that share round sources")
+    parser.add_argument("config", help="JSON file with the board definitions")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="where fetched round sources are cached")
+    parser.add_argument("--no-cache", action="store_true", help="always download every round in full")
+    parser.add_argument("--offline", action="store_true", help="only use cached round sources")
+    parser.add_argument("--max-age", type=float, default=None,
+                        help="seconds a cached source is used without revalidating it")
+    parser.add_argument("--metrics", default=None,
+                        help="write stage timings and counters here (*.prom = Prometheus textfile, else JSON)")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="-v: progress messages, -vv: every parse and merge decision")
+    args = parser.parse_args()
+    logging.basicConfig(format="%(message)s",
+                        level=[logging.WARNING, logging.INFO, logging.DEBUG][min(args.verbose, 2)])
+    cache = None if args.no_cache else FetchCache(args.cache_dir, max_age=args.max_age, offline=args.offline)
+
+    failed = build_all(load_boards(args.config), cache=cache, workers=args.workers)
+    if args.metrics:
+        metrics.write(args.metrics)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,215 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from newscraper import (extract_markdown_table, iter_text_lines, parse_document, read_table, stream_table,
+                        normalize_team_names, get_leaderboard_dataframe)
+from leaderboard_gen import generate_leaderboard
+from local_server import start_server
+from synthetic import write_results_repo
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+# Stages faster than this are reported but never count as a regression: timer and scheduler noise dominates
+MIN_TIMED_SECONDS = 0.005
+
+
+def synthetic_results(rows, seed=0):
+    """
+    ERC-style results file: some prose, the results table, then a trailing table
+    """
+    rng = random.Random(seed)
+    lines = ["# Results", "", "Scores below are final.", "",
+             "| No. | Team name | University | Score | Comment |",
+             "|---|:---:|---|---|---|"]
+    for i in range(rows):
+        lines.append(f"| {i + 1} | Team {i} | University {rng.randint(1, 500)} | {rng.randint(0, 100)} | ok |")
+    lines += ["", "Jury notes follow.", "", "| Judge | Note |", "|---|---|"]
+    lines += [f"| Judge {i} | {'x' * 40} |" for i in range(rows)]
+    return "\n".join(lines) + "\n"
+
+
+def _old_parse(md_text):
+    # The previous path: extract the whole table into a DataFrame, then clean it
+    df = extract_markdown_table(md_text, "Team name", "Score")
+    df = df[["Team name", "Score"]].copy()
+    df["Score"] = pd.to_numeric(df["Score"], errors="coerce").fillna(0)
+    return df[df["Team name"].str.strip() != ""]
+
+
+def _new_parse(md_text):
+    # What the build runs for a document several rounds read: every table of it, then two columns of one
+    return read_table(parse_document(md_text), "Team name", "Score")
+
+
+def _stream_parse(md_text):
+    # What the build runs for a document one round reads: up to the end of its table only
+    return stream_table(iter_text_lines(md_text), "Team name", "Score")
+
+
+def measure(func, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def bench_parser(sizes, repeat):
+    print(f"{'rows':>8} {'old s':>10} {'document s':>11} {'stream s':>10} {'speedup':>8} "
+          f"{'old peak MB':>12} {'doc peak MB':>12} {'stream peak MB':>15}")
+    for rows in sizes:
+        md_text = synthetic_results(rows)
+        old_time, old_peak = measure(_old_parse, md_text, repeat)
+        new_time, new_peak = measure(_new_parse, md_text, repeat)
+        stream_time, stream_peak = measure(_stream_parse, md_text, repeat)
+        print(f"{rows:>8} {old_time:>10.4f} {new_time:>11.4f} {stream_time:>10.4f} {old_time / stream_time:>7.1f}x "
+              f"{old_peak / 1e6:>12.2f} {new_peak / 1e6:>12.2f} {stream_peak / 1e6:>15.2f}")
+
+
+def time_stage(func, repeat):
+    """
+    Best and median wall time of func() over `repeat` runs
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "median": statistics.median(times)}
+
+
+def run_suite(teams, rounds, noise, duplicates, repeat, seed=0):
+    """
+    Time every stage on a synthetic results repo served over local HTTP
+    """
+    with tempfile.TemporaryDirectory() as repo_dir:
+        config = write_results_repo(repo_dir, teams, rounds, noise, duplicates, seed)
+        server, base_url = start_server(repo_dir)
+        try:
+            rounds_config = [(num, name, base_url + path, team_col, score_col)
+                             for num, name, path, team_col, score_col in config]
+            with open(os.path.join(repo_dir, config[0][2]), encoding="utf-8") as f:
+                md_text = f.read()
+            all_names = []
+            for _, _, path, _, _ in config:
+                with open(os.path.join(repo_dir, path), encoding="utf-8") as f:
+                    table = read_table(parse_document(f.read()), "Team name", "Score")
+                all_names.extend(table[0])
+            output_path = os.path.join(repo_dir, "index.html")
+
+            results = {
+                "extract_markdown_table": time_stage(
+                    lambda: extract_markdown_table(md_text, "Team name", "Score"), repeat),
+                "parse_document": time_stage(
+                    lambda: read_table(parse_document(md_text), "Team name", "Score"), repeat),
+                "normalize_team_names": time_stage(lambda: normalize_team_names(all_names), repeat),
+                "get_leaderboard_dataframe": time_stage(lambda: get_leaderboard_dataframe(rounds_config), repeat),
+                "generate_leaderboard": time_stage(
+                    lambda: generate_leaderboard(rounds_config, output_path=output_path), repeat),
+            }
+        finally:
+            server.shutdown()
+
+    return {
+        "meta": {
+            "teams": teams,
+            "rounds": rounds,
+            "noise": noise,
+            "duplicates": duplicates,
+            "repeat": repeat,
+            "name_instances": len(all_names),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """
+    Print each stage against the baseline; returns the stages that got slower
+    than baseline * (1 + tolerance). Stages shorter than MIN_TIMED_SECONDS
+    are shown but not checked.
+    """
+    regressions = []
+    print(f"{'stage':<28} {'best s':>10} {'baseline s':>11} {'change':>8}")
+    for stage, timing in report["results"].items():
+        base = baseline.get("results", {}).get(stage)
+        if base is None:
+            print(f"{stage:<28} {timing['best']:>10.4f} {'-':>11} {'new':>8}")
+            continue
+        change = timing["best"] / base["best"] - 1 if base["best"] else 0.0
+        flag = ""
+        if base["best"] < MIN_TIMED_SECONDS:
+            flag = "  (too short to check)"
+        elif change > tolerance:
+            regressions.append(stage)
+            flag = "  REGRESSION"
+        print(f"{stage:<28} {timing['best']:>10.4f} {base['best']:>11.4f} {change:>+7.0%}{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Leaderboard benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_cmd = commands.add_parser("parser", help="old DataFrame parser vs the two the build uses")
+    parser_cmd.add_argument("--sizes", type=int, nargs="+", default=[50, 1000, 20000, 200000])
+    parser_cmd.add_argument("--repeat", type=int, default=3)
+
+    suite_cmd = commands.add_parser("suite", help="time every stage end to end against a local HTTP server")
+    suite_cmd.add_argument("--teams", type=int, default=200)
+    suite_cmd.add_argument("--rounds", type=int, default=8)
+    suite_cmd.add_argument("--noise", type=float, default=0.2, help="share of rows with a name variant/typo")
+    suite_cmd.add_argument("--duplicates", type=float, default=0.02, help="share of teams listed twice in a round")
+    suite_cmd.add_argument("--repeat", type=int, default=5)
+    suite_cmd.add_argument("--output", default="bench_results.json", help="where the JSON report is written")
+    suite_cmd.add_argument("--baseline", default=DEFAULT_BASELINE)
+    suite_cmd.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    suite_cmd.add_argument("--tolerance", type=float, default=0.25,
+                           help="allowed slowdown vs baseline before failing (0.25 = 25%%)")
+
+    args = parser.parse_args()
+    if args.command == "parser":
+        bench_parser(args.sizes, args.repeat)
+        sys.exit(0)
+
+    report = run_suite(args.teams, args.rounds, args.noise, args.duplicates, args.repeat)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        compare(report, {}, args.tolerance)
+        sys.exit(0)
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("meta", {}).get("teams") != args.teams or baseline.get("meta", {}).get("rounds") != args.rounds:
+        print("Warning: baseline was recorded with a different --teams/--rounds")
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print(f"Slower than baseline: {', '.join(regressions)}")
+        sys.exit(1)
@@ -0,0 +1,115 @@
+from array import array
+
+DEFAULT_ROUND_SLOTS = range(1, 9)
+
+# From this many score rows on, summing with numpy (assembly.py) beats a plain loop
+NUMPY_MIN_ROWS = 50000
+
+
+class Board:
+    """
+    The leaderboard as compact columns, without pandas.
+
+    teams: team names, one per row
+    columns: round column names
+    scores: one int64 array per round column, aligned with teams
+    totals: int64 array of row sums
+    positions: competition ranks once rank() was called, else None
+    """
+
+    __slots__ = ("teams", "columns", "scores", "totals", "positions")
+
+    def __init__(self, teams, columns, scores, totals=None, positions=None):
+        self.teams = list(teams)
+        self.columns = list(columns)
+        self.scores = [array("q", col) for col in scores]
+        if totals is None:
+            totals = map(sum, zip(*self.scores)) if self.scores else [0] * len(self.teams)
+        self.totals = array("q", totals)
+        self.positions = None if positions is None else array("q", positions)
+
+    def __len__(self):
+        return len(self.teams)
+
+    def header(self):
+        return ["Team"] + self.columns + ["Total"]
+
+    def rows(self):
+        """
+        [team, score..., total] per team, the layout of header()
+        """
+        return [[team, *scores, total] for team, scores, total
+                in zip(self.teams, zip(*self.scores) if self.scores else [()] * len(self.teams), self.totals)]
+
+    @classmethod
+    def from_rows(cls, header, rows):
+        """
+        Inverse of header()/rows()
+        """
+        columns = header[1:-1]
+        return cls([row[0] for row in rows], columns,
+                   [[row[k + 1] for row in rows] for k in range(len(columns))],
+                   [row[-1] for row in rows])
+
+    def rank(self):
+        """
+        Sort by total (highest first, ties by team name) and set competition
+        ranks: equal totals share a position and the next one is skipped.
+        Same result as rank(method="min") + sort_values(["Total", "Team"]) on a DataFrame.
+        """
+        order = sorted(range(len(self.teams)), key=lambda i: (-self.totals[i], self.teams[i]))
+        self.teams = [self.teams[i] for i in order]
+        self.scores = [array("q", [col[i] for i in order]) for col in self.scores]
+        self.totals = array("q", [self.totals[i] for i in order])
+        positions = array("q")
+        for k, total in enumerate(self.totals):
+            positions.append(positions[-1] if k and total == self.totals[k - 1] else k + 1)
+        self.positions = positions
+        return self
+
+
+def round_columns(round_nums, round_names, round_slots=DEFAULT_ROUND_SLOTS):
+    """
+    Column layout of the board: each slot gets the names of the rounds
+    configured for it (in config order), or a "Round N" placeholder.
+    Returns (column names, column index of each round or -1 if its slot is not shown)
+    """
+    columns = []
+    column_of = [-1] * len(round_nums)
+    for slot in round_slots:
+        matching = [k for k, num in enumerate(round_nums) if num == slot]
+        if matching:
+            for k in matching:
+                column_of[k] = len(columns)
+                columns.append(round_names[k])
+        else:
+            columns.append(f"Round {slot}")
+    return columns, column_of
+
+
+def assemble_board(rounds, round_slots=DEFAULT_ROUND_SLOTS):
+    """
+    Build the team x round board in one pass.
+
+    rounds: list of (round_num, round_name, teams, scores) with normalized team names
+    Teams are sorted by name; duplicate rows within a round add up, and the sums
+    are truncated to int like DataFrame.astype(int). Very large inputs go through
+    the numpy version in assembly.py, which gives the same board.
+    """
+    if sum(len(r[2]) for r in rounds) >= NUMPY_MIN_ROWS:
+        from assembly import assemble_leaderboard
+        teams, columns, matrix = assemble_leaderboard(rounds, round_slots)
+        return Board(teams, columns, matrix.T.tolist())
+
+    columns, column_of = round_columns([r[0] for r in rounds], [r[1] for r in rounds], round_slots)
+    teams = sorted({team for r in rounds for team in r[2]})
+    row_of = {team: i for i, team in enumerate(teams)}
+    sums = [[0] * len(teams) for _ in columns]
+    for (_, _, round_teams, round_scores), column in zip(rounds, column_of):
+        # Rounds whose slot is not on the board still contribute their teams, but no scores
+        if column < 0:
+            continue
+        col = sums[column]
+        for team, score in zip(round_teams, round_scores):
+            col[row_of[team]] += score
+    return Board(teams, columns, [[int(value) for value in col] for col in sums])
@@ -0,0 +1,121 @@
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BACKGROUND_SOURCE = os.path.join("assets", "mars.jpg")
+BACKGROUND_WIDTHS = (1920, 1280, 768)
+
+logger = logging.getLogger(__name__)
+
+
+def leaderboard_json(board):
+    """
+    Compact columnar form of a ranked Board. No timestamp, so unchanged data
+    always serializes to the same bytes (and the same hash).
+    """
+    data = {
+        "rounds": board.columns,
+        "team": board.teams,
+        "position": board.positions.tolist(),
+        "total": board.totals.tolist(),
+        "scores": [col.tolist() for col in board.scores],
+    }
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_leaderboard_json(board, site_dir="."):
+    """
+    Write leaderboard.json and a content-hashed leaderboard.<hash>.json that
+    browsers/CDNs can cache forever; the page links the hashed one.
+    Returns [plain path, hashed path].
+    """
+    payload = leaderboard_json(board)
+    digest = hashlib.sha256(payload).hexdigest()[:12]
+    plain_path = os.path.join(site_dir, "leaderboard.json")
+    hashed_path = os.path.join(site_dir, f"leaderboard.{digest}.json")
+
+    # Old hashed copies would otherwise pile up next to the page
+    for stale in glob.glob(os.path.join(site_dir, "leaderboard.*.json")):
+        if stale != hashed_path:
+            for path in (stale, stale + ".gz", stale + ".br"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    for path in (plain_path, hashed_path):
+        with open(path, "wb") as f:
+            f.write(payload)
+    return [plain_path, hashed_path]
+
+
+def precompress(paths):
+    """
+    Write .gz (and .br when the brotli module is installed) next to each file.
+    gzip mtime is pinned so identical input gives identical output.
+    """
+    written = []
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path + ".gz", "wb") as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        written.append(path + ".gz")
+        if brotli is not None:
+            with open(path + ".br", "wb") as f:
+                f.write(brotli.compress(data, quality=11))
+            written.append(path + ".br")
+    if brotli is None:
+        logger.warning("brotli not installed, wrote .gz only")
+    return written
+
+
+def _is_fresh(target, source):
+    return os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source)
+
+
+def optimize_background(site_dir=".", source=BACKGROUND_SOURCE, widths=BACKGROUND_WIDTHS):
+    """
+    Resized, recompressed JPEG and WebP copies of the background image
+    (assets/mars-1920.jpg, assets/mars-1920.webp, ...). Needs Pillow; existing
+    copies newer than the source are kept.
+    Returns [(width, jpg path, webp path)] site-relative, widest first, for
+    render_leaderboard to pick from, or None if nothing was made.
+    """
+    # Imported here, Pillow alone takes longer to load than a plain build
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None
+    source_path = os.path.join(site_dir, source)
+    if Image is None:
+        logger.warning("Pillow not installed, keeping the original background image")
+        return None
+    if not os.path.exists(source_path):
+        return None
+
+    root, _ = os.path.splitext(source)
+    variants = []
+    image = None
+    for width in sorted(widths, reverse=True):
+        paths = []
+        for ext, options in ((".jpg", {"quality": 80, "optimize": True, "progressive": True}),
+                             (".webp", {"quality": 75, "method": 6})):
+            relative = f"{root}-{width}{ext}"
+            target = os.path.join(site_dir, relative)
+            if not _is_fresh(target, source_path):
+                if image is None:
+                    image = Image.open(source_path).convert("RGB")
+                resized = image
+                if image.width > width:
+                    resized = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+                resized.save(target, **options)
+            paths.append(relative.replace(os.sep, "/"))
+        variants.append((width, *paths))
+    return variants or None
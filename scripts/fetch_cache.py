@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "erc-leaderboard")
+DEFAULT_CACHE_DIR = os.path.join(CACHE_ROOT, "fetch")
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class FetchCache:
+    """
+    Persistent cache of fetched round sources.
+
+    Each URL keeps its body on disk next to the ETag / Last-Modified validators
+    and a sha256 of the body, so the next run can send a conditional request
+    and reuse the body on a 304.
+    max_age: seconds an entry is trusted without asking upstream (None = always revalidate)
+    max_bytes: total body size kept on disk, least recently used entries go first
+    offline: never touch the network, only serve what is cached
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_age=None, max_bytes=DEFAULT_MAX_BYTES, offline=False):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._entries = self._load_index()
+
+    def _index_path(self):
+        return os.path.join(self.cache_dir, self.INDEX_FILE)
+
+    def _body_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".md")
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def lookup(self, url):
+        """
+        Return the cache entry for url with its body loaded, or None
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return None
+        try:
+            with open(self._body_path(url), encoding="utf-8", newline="") as f:
+                body = f.read()
+        except OSError:
+            return None
+        # A body that no longer matches its hash is treated as a miss
+        if content_hash(body) != entry["sha256"]:
+            return None
+        return dict(entry, body=body)
+
+    def is_fresh(self, entry):
+        if self.max_age is None:
+            return False
+        return time.time() - entry["fetched_at"] < self.max_age
+
+    @staticmethod
+    def conditional_headers(entry):
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, body, etag=None, last_modified=None):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._body_path(url)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            self._entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "sha256": content_hash(body),
+                "size": len(body.encode("utf-8")),
+                "fetched_at": now,
+                "used_at": now,
+            }
+
+    def touch(self, url, revalidated=False):
+        """
+        Mark an entry as used, and as revalidated after a 304
+        """
+        now = time.time()
+        with self._lock:
+            if url in self._entries:
+                self._entries[url]["used_at"] = now
+                if revalidated:
+                    self._entries[url]["fetched_at"] = now
+
+    def evict(self):
+        """
+        Drop least recently used entries until the cache fits in max_bytes
+        """
+        with self._lock:
+            total = sum(entry["size"] for entry in self._entries.values())
+            if self.max_bytes is None or total <= self.max_bytes:
+                return []
+            evicted = []
+            for url, entry in sorted(self._entries.items(), key=lambda item: item[1]["used_at"]):
+                if total <= self.max_bytes:
+                    break
+                total -= entry["size"]
+                evicted.append(url)
+            for url in evicted:
+                del self._entries[url]
+                try:
+                    os.remove(self._body_path(url))
+                except OSError:
+                    pass
+        if evicted:
+            logger.info("Evicted %d cached sources to stay under %d bytes", len(evicted), self.max_bytes)
+        return evicted
+
+    def save(self):
+        self.evict()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self._index_path() + ".tmp"
+        with self._lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self._index_path())
@@ -0,0 +1,216 @@
+import bisect
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from fetch_cache import CACHE_ROOT
+
+DEFAULT_HISTORY_DIR = os.path.join(CACHE_ROOT, "history")
+
+
+class ScoreHistory:
+    """
+    Append-only store of every leaderboard a build produced.
+
+    teams.json      team name of each team id (ids never change)
+    columns.json    round column name of each column id
+    snapshots.bin   one record per snapshot: time, content digest (hex), where its rows live
+    team_ids.bin    int32 team id per row, ascending within a snapshot
+    totals.bin      int64 total per row
+    scores.bin      int64 rows x columns of each snapshot (column ids 0..cols-1)
+
+    Data files are written before the snapshot record, so a crash mid-append
+    leaves at most some bytes no record points to; the next append overwrites them.
+    Queries memory-map only the rows of the snapshots they need.
+    """
+
+    RECORD = np.dtype([("time", "<f8"), ("digest", "S16"), ("row_offset", "<i8"), ("rows", "<i4"), ("cols", "<i4")])
+
+    def __init__(self, history_dir=DEFAULT_HISTORY_DIR):
+        self.history_dir = history_dir
+        self.teams = self._read_json("teams.json")
+        self.columns = self._read_json("columns.json")
+        self._team_ids = {team: i for i, team in enumerate(self.teams)}
+        self._column_ids = {col: i for i, col in enumerate(self.columns)}
+
+    def _path(self, name):
+        return os.path.join(self.history_dir, name)
+
+    def _read_json(self, name):
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def _write_json(self, name, data):
+        tmp_path = self._path(name) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(name))
+
+    def _map(self, name, dtype, offset, count):
+        """
+        Read-only view of count items starting at item offset, without reading the rest
+        """
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self._path(name), dtype=dtype, mode="r", offset=offset * np.dtype(dtype).itemsize,
+                         shape=(count,))
+
+    def records(self):
+        """
+        The snapshot index: a structured array with one record per snapshot
+        """
+        path = self._path("snapshots.bin")
+        if not os.path.exists(path):
+            return np.zeros(0, dtype=self.RECORD)
+        count = os.path.getsize(path) // self.RECORD.itemsize
+        return self._map("snapshots.bin", self.RECORD, 0, count)
+
+    def __len__(self):
+        return len(self.records())
+
+    def times(self):
+        return self.records()["time"].tolist()
+
+    def _intern(self, names, ids, table):
+        for name in names:
+            if name not in ids:
+                ids[name] = len(table)
+                table.append(name)
+        return [ids[name] for name in names]
+
+    def append(self, board, timestamp=None):
+        """
+        Add a snapshot of an assembled Board. A board identical to the latest
+        snapshot is not stored again. Returns the snapshot index.
+        """
+        os.makedirs(self.history_dir, exist_ok=True)
+        timestamp = time.time() if timestamp is None else timestamp
+
+        team_ids = self._intern(board.teams, self._team_ids, self.teams)
+        column_ids = self._intern(board.columns, self._column_ids, self.columns)
+        rows = len(team_ids)
+        cols = max(column_ids) + 1 if column_ids else 0
+        matrix = np.zeros((rows, cols), dtype=np.int64)
+        for column_id, values in zip(column_ids, board.scores):
+            matrix[:, column_id] = values
+        order = np.argsort(np.asarray(team_ids, dtype=np.int32), kind="stable")
+        team_ids = np.asarray(team_ids, dtype=np.int32)[order]
+        matrix = matrix[order]
+        totals = np.asarray(board.totals, dtype=np.int64)[order]
+
+        # Hex text, not raw bytes: an S16 field drops trailing NULs when read back
+        content = team_ids.tobytes() + matrix.tobytes() + np.int64(cols).tobytes()
+        digest = hashlib.sha256(content).hexdigest()[:16].encode()
+        records = self.records()
+        if len(records) and records[-1]["digest"] == digest:
+            return len(records) - 1
+
+        row_offset = int(records[-1]["row_offset"] + records[-1]["rows"]) if len(records) else 0
+        cell_offset = self._cell_offset(records)
+        self._write_json("teams.json", self.teams)
+        self._write_json("columns.json", self.columns)
+        for name, data, offset in (("team_ids.bin", team_ids, row_offset),
+                                   ("totals.bin", totals, row_offset),
+                                   ("scores.bin", matrix, cell_offset)):
+            self._append_at(name, data, offset)
+
+        record = np.zeros(1, dtype=self.RECORD)
+        record[0] = (timestamp, digest, row_offset, rows, cols)
+        self._append_at("snapshots.bin", record, len(records))
+        return len(records)
+
+    def _cell_offset(self, records):
+        # Snapshots are small and few; summing rows * cols of the index is cheap
+        return int((records["rows"].astype(np.int64) * records["cols"]).sum()) if len(records) else 0
+
+    def _append_at(self, name, data, item_offset):
+        path = self._path(name)
+        mode = "r+b" if os.path.exists(path) else "w+b"
+        with open(path, mode) as f:
+            f.truncate(item_offset * data.dtype.itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(data.tobytes())
+
+    def snapshot_at(self, timestamp):
+        """
+        Index of the latest snapshot taken at or before timestamp, or None
+        """
+        position = bisect.bisect_right(self.times(), timestamp)
+        return position - 1 if position else None
+
+    @staticmethod
+    def _resolve(snapshot, records):
+        index = snapshot + len(records) if snapshot < 0 else snapshot
+        if not 0 <= index < len(records):
+            raise IndexError(f"No snapshot {snapshot} ({len(records)} stored)")
+        return index
+
+    def _totals(self, record):
+        start, rows = int(record["row_offset"]), int(record["rows"])
+        return self._map("team_ids.bin", np.int32, start, rows), self._map("totals.bin", np.int64, start, rows)
+
+    def positions(self, snapshot=-1):
+        """
+        {team: competition rank} in one snapshot (negative = counted from the latest)
+        """
+        records = self.records()
+        team_ids, totals = self._totals(records[self._resolve(snapshot, records)])
+        totals = totals.tolist()
+        # Equal totals share the position of the first of them
+        rank_of = {}
+        for place, total in enumerate(sorted(totals, reverse=True), 1):
+            rank_of.setdefault(total, place)
+        return {self.teams[team_id]: rank_of[total] for team_id, total in zip(team_ids.tolist(), totals)}
+
+    def rank_change(self, since, snapshot=-1):
+        """
+        {team: places gained since snapshot `since`} for every team in `snapshot`.
+        Positive = moved up, None = team was not on the board back then.
+        """
+        before = self.positions(since)
+        return {team: (before[team] - position if team in before else None)
+                for team, position in self.positions(snapshot).items()}
+
+    def load(self, snapshot=-1):
+        """
+        (teams, columns, scores matrix) of one snapshot
+        """
+        records = self.records()
+        index = self._resolve(snapshot, records)
+        record = records[index]
+        rows, cols = int(record["rows"]), int(record["cols"])
+        team_ids, _ = self._totals(record)
+        cells = self._map("scores.bin", np.int64, self._cell_offset(records[:index]), rows * cols)
+        return [self.teams[i] for i in team_ids.tolist()], self.columns[:cols], cells.reshape(rows, cols)
+
+    def trajectory(self, team):
+        """
+        [(time, total, position)] of a team over every snapshot it appears in.
+        Reads only the id and total columns, never the score matrices.
+        """
+        team_id = self._team_ids.get(team)
+        if team_id is None:
+            return []
+        records = self.records()
+        if not len(records):
+            return []
+        # One mapping for the whole id/total columns; only the pages searched get read
+        row_count = int(records[-1]["row_offset"] + records[-1]["rows"])
+        all_ids = self._map("team_ids.bin", np.int32, 0, row_count)
+        all_totals = self._map("totals.bin", np.int64, 0, row_count)
+        result = []
+        for record in records:
+            start = int(record["row_offset"])
+            end = start + int(record["rows"])
+            team_ids, totals = all_ids[start:end], all_totals[start:end]
+            k = int(np.searchsorted(team_ids, team_id))
+            if k < len(team_ids) and team_ids[k] == team_id:
+                total = int(totals[k])
+                result.append((float(record["time"]), total, int((totals > total).sum()) + 1))
+        return result
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+import os
+
+from fetch_cache import CACHE_ROOT
+
+DEFAULT_STATE_DIR = os.path.join(CACHE_ROOT, "state")
+
+# Bump when the parse/clean/assemble output format changes so old state is ignored
+STATE_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(parts):
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class BuildState:
+    """
+    Results of the previous build, keyed by content hash, so unchanged rounds
+    are not parsed/cleaned again and an unchanged build skips assembly and rendering.
+
+    rounds/<key>.json  cleaned (Team, score) table of one round
+    build.json         fingerprint + assembled leaderboard of the last build
+    rendered.json      fingerprint + path of the last page written
+    """
+
+    def __init__(self, state_dir=DEFAULT_STATE_DIR):
+        self.state_dir = state_dir
+        self.stages = {}
+        self.unchanged = False
+        self.fingerprint = None
+        self._round_keys = []
+
+    def _path(self, *parts):
+        return os.path.join(self.state_dir, *parts)
+
+    def _read_json(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_json(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def mark(self, stage, detail):
+        self.stages[stage] = detail
+
+    @staticmethod
+    def round_key(content_digest, round_name, team_col, score_col, table=None):
+        parts = [STATE_VERSION, content_digest, round_name, team_col, score_col]
+        return _digest(parts + [table] if table is not None else parts)
+
+    def load_round(self, key):
+        """
+        Return the cleaned (teams, scores) of a round seen before, or None
+        """
+        self._round_keys.append(key)
+        data = self._read_json(self._path("rounds", key + ".json"))
+        if data is None:
+            return None
+        return data["teams"], data["scores"]
+
+    def save_round(self, key, teams, scores):
+        self._write_json(self._path("rounds", key + ".json"), {"teams": teams, "scores": scores})
+
+    def begin_assembly(self, round_parts):
+        """
+        Fingerprint the inputs of assembly; returns the previous leaderboard
+        (columns, rows) if it was built from exactly the same inputs
+        """
+        self.fingerprint = _digest([STATE_VERSION, round_parts])
+        previous = self._read_json(self._path("build.json"))
+        if previous is not None and previous["fingerprint"] == self.fingerprint:
+            self.unchanged = True
+            return previous["columns"], previous["rows"]
+        return None
+
+    def save_assembly(self, columns, rows):
+        self._write_json(self._path("build.json"), {
+            "fingerprint": self.fingerprint,
+            "columns": columns,
+            "rows": rows,
+        })
+        # Rounds not used by this build will not come back unchanged, drop them
+        keep = {key + ".json" for key in self._round_keys}
+        rounds_dir = self._path("rounds")
+        for name in os.listdir(rounds_dir) if os.path.isdir(rounds_dir) else []:
+            if name not in keep:
+                os.remove(os.path.join(rounds_dir, name))
+
+    @staticmethod
+    def _file_digest(path):
+        try:
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def can_skip_render(self, output_path, options=None):
+        """
+        True only if nothing changed, the output options (paging, export, ...) are
+        the same and the page on disk is exactly the one we wrote last time
+        """
+        if not self.unchanged:
+            return False
+        rendered = self._read_json(self._path("rendered.json"))
+        return (rendered is not None
+                and rendered["fingerprint"] == self.fingerprint
+                and rendered["output"] == os.path.abspath(output_path)
+                and rendered.get("options") == options
+                and rendered["sha256"] == self._file_digest(output_path))
+
+    def save_render(self, output_path, options=None):
+        self._write_json(self._path("rendered.json"), {
+            "fingerprint": self.fingerprint,
+            "output": os.path.abspath(output_path),
+            "options": options,
+            "sha256": self._file_digest(output_path),
+        })
+
+    def report(self):
+        logger.info("Incremental build summary:")
+        for stage, detail in self.stages.items():
+            logger.info("  %s: %s", stage, detail)
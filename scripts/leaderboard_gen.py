@@ -1,139 +1,140 @@
-import pandas as pd
-from newscraper import get_leaderboard_dataframe
-from datetime import datetime, timezone
-
-def generate_leaderboard(rounds_config=None):
-    df = get_leaderboard_dataframe(rounds_config)
-    df["Total"] = df[[col for col in df.columns if col.startswith("Round") or col not in ["Team", "Total"]]].sum(axis=1)
+import argparse
+import logging
+from board import Board
+from newscraper import build_leaderboard, expand_rounds
+from fetch_cache import FetchCache, DEFAULT_CACHE_DIR
+from incremental import BuildState, DEFAULT_STATE_DIR
+from alias_registry import AliasRegistry
+from render import LivePage, render_leaderboard
+from export import optimize_background, precompress, write_leaderboard_json
+from watch import watch
+from metrics import metrics
+from sources import local_base
+import os
+
+UPSTREAM_BASE = "https://raw.githubusercontent.com/husarion/erc2025/refs/heads/main/"
+
+logger = logging.getLogger(__name__)
+
+def generate_leaderboard(rounds_config=None, cache=None, build_state=None, output_path="index.html", registry=None,
+                         page_size=None, export=False, sources=None, tables=None, history=None, live=None,
+                         score_cache=None, workers=1):
+    board = build_leaderboard(rounds_config, cache=cache, build_state=build_state, registry=registry,
+                              sources=sources, tables=tables, history=history, score_cache=score_cache,
+                              workers=workers)
+    # Everything besides the board that changes what gets written
+    render_options = {"page_size": page_size, "export": export, "history": history is not None}
+    if build_state is not None and build_state.can_skip_render(output_path, render_options):
+        build_state.mark("render", f"skipped ({output_path} is up to date)")
+        build_state.report()
+        return
+    if board is None:
+        board = Board([], [], [])
 
     # Rank with ties (same score = same rank)
-    df["Position"] = df["Total"].rank(method="min", ascending=False).astype(int)
-    df = df.sort_values(by=["Total", "Team"], ascending=[False, True])
-    
-
-    print(df.head())
-    print("Shape:", df.shape)
-
-    round_columns = [col for col in df.columns if col not in ["Team", "Total", "Position"]]
-
-
-    rows_html = ""
-    for _, row in df.iterrows():
-        rank = row["Position"]
-        team = row["Team"]
-        total = int(row["Total"])
-        round_scores = [
-            f'<td>{int(row[col])}</td>' if row[col] != 0 else '<td class="empty-cell">-</td>'
-            for col in round_columns
-        ]
-        rank_class = f"rank-{rank}" if rank <= 3 else "rank"
-        row_html = f"""
-        <tr class="hover:bg-slate-700 transition-all duration-150">
-          <td><div class="rank {rank_class}">{rank}</div></td>
-          <td>{team}</td>
-          {''.join(round_scores)}
-          <td><span class="total-score">{total}</span></td>
-        </tr>
-        """
-        rows_html += row_html
-
-    round_headers = ''.join([f'<th class="px-4 py-3">{col}</th>' for col in round_columns])
-
-    # The final HTML output
-    html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1.0"/>
-  <title>ERC-2025 Leaderboard</title>
-  <script src="https://cdn.tailwindcss.com"></script>
-  <style>
-        body {{
-          font-family: 'Inter', sans-serif;
-          color: #e2e8f0;
-          background: url('assets/mars.jpg') no-repeat center center fixed;
-          background-size: cover;
-        }}
-
-    .rank {{
-      font-weight: bold;
-      font-size: 1rem;
-      background-color: #334155;
-      border-radius: 9999px;
-      width: 35px;
-      height: 35px;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      margin: auto;
-    }}
-
-    .rank-1 {{
-      background: linear-gradient(135deg, #fde047, #f59e0b);
-      box-shadow: 0 0 10px rgba(245, 158, 11, 0.5);
-    }}
-
-    .rank-2 {{
-      background: linear-gradient(135deg, #e5e7eb, #9ca3af);
-      box-shadow: 0 0 10px rgba(156, 163, 175, 0.5);
-    }}
-
-    .rank-3 {{
-      background: linear-gradient(135deg, #f97316, #b45309);
-      box-shadow: 0 0 10px rgba(180, 83, 9, 0.5);
-    }}
-    
-  </style>
-</head>
-<body>
-  <div class="overlay">
-    <div class="max-w-7xl mx-auto">
-        <div class="flex flex-col items-center mb-6">
-          <img src="assets/logo.png" alt="ERC Logo" class="w-80 h-auto mb-4" />
-          <h1 class="text-5xl font-bold glow text-center text-gray-800">Live Leaderboard</h1>
-        </div>
-
-      <div class="overflow-x-auto rounded-lg shadow-md">
-        <table class="min-w-full divide-y divide-slate-700 bg-slate-800 text-sm text-center">
-          <thead class="bg-slate-900 text-slate-300 uppercase tracking-wider text-xs">
-            <tr>
-              <th class="px-4 py-3">Position</th>
-              <th class="px-4 py-3">Team</th>
-              {round_headers}
-              <th class="px-4 py-3">Total</th>
-            </tr>
-          </thead>
-          <tbody class="divide-y divide-slate-700">
-            {rows_html}
-          </tbody>
-        </table>
-      </div>
-    </div>
-  </div>
-
-
-<!-- Animated Footer -->
-<footer style="font-family: inherit; font-size: 1.1em; text-align: center; margin-top: 1em;">
-        <div class="text-center text-white-400 text-l mt-6">
-          Last updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}
-        </div>
-  Made with 
-  <span class="inline-block animate-bounce mx-1">❤️</span>
-  by IITB Mars Rover Team
-</footer>
-
-</body>
-</html>
-"""
-    with open("index.html", "w", encoding="utf-8") as f:
-        f.write(html)
+    rows = None
+    if live is not None and history is None:
+        # Only rows whose position or scores changed since the last build get rendered
+        board, rows = live.update(board)
+    else:
+        board.rank()
+
+    changes = None
+    if history is not None and len(history) >= 2:
+        # The latest snapshot is this board; arrows compare with the one before
+        moves = history.rank_change(-2)
+        changes = [moves.get(team) for team in board.teams]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for row in [board.header()] + board.rows()[:5]:
+            logger.debug("%s", row)
+    logger.info("Shape: (%d, %d)", len(board), len(board.columns) + 3)
+
+    site_dir = os.path.dirname(output_path) or "."
+    background = "assets/mars.jpg"
+    exported = []
+    data = None
+    if export:
+        with metrics.stage("export"):
+            # Smaller recompressed backgrounds, if Pillow is available
+            background = optimize_background(site_dir) or background
+            # Written first so every page can link the hashed copy
+            exported = write_leaderboard_json(board, site_dir)
+            data = os.path.basename(exported[1])
+
+    with metrics.stage("render"):
+        written = render_leaderboard(board, output_path, page_size=page_size, background=background,
+                                     changes=changes, rows=rows, data=data)
+    metrics.count("pages_written", len(written))
+
+    if export:
+        with metrics.stage("export"):
+            precompress(written + exported)
+
+    if build_state is not None:
+        build_state.save_render(output_path, render_options)
+        build_state.mark("render", "ran")
+        build_state.report()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the ERC leaderboard page")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="where fetched round sources are cached")
+    parser.add_argument("--no-cache", action="store_true", help="always download every round in full")
+    parser.add_argument("--offline", action="store_true", help="only use cached round sources")
+    parser.add_argument("--max-age", type=float, default=None,
+                        help="seconds a cached source is used without revalidating it")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse results for unchanged rounds and skip the page write if nothing changed")
+    parser.add_argument("--state-dir", default=DEFAULT_STATE_DIR, help="where incremental build state is kept")
+    parser.add_argument("--aliases", default=None,
+                        help="alias registry JSON; known team names skip fuzzy matching and keep their canonical name")
+    parser.add_argument("--score-cache", action="store_true",
+                        help="keep fuzzy-match scores of team name pairs between builds")
+    parser.add_argument("--score-cache-file", default=None, help="where the name pair scores are kept")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="cores used to fuzzy-match team names in large batches (-1 = all)")
+    parser.add_argument("--page-size", type=int, default=None,
+                        help="split the board into pages of this many teams (index.html, index-2.html, ...)")
+    parser.add_argument("--export", action="store_true",
+                        help="also write leaderboard.json, .gz/.br copies and resized background images")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running, poll the sources and rebuild only when one changes")
+    parser.add_argument("--interval", type=float, default=30.0, help="seconds between polls in --watch mode")
+    parser.add_argument("--mirror", default=None,
+                        help=f"base URL to fetch from instead of {UPSTREAM_BASE} (e.g. scripts/local_server.py)")
+    parser.add_argument("--source-dir", default=None,
+                        help="read the rounds from this checkout of the results repo instead of downloading them")
+    parser.add_argument("--source-git", default=None, metavar="REPO[@REF]",
+                        help="read the rounds from a git ref of a local clone (default ref: HEAD)")
+    parser.add_argument("--history", action="store_true",
+                        help="keep a snapshot of every build and show rank movement arrows on the page")
+    parser.add_argument("--history-dir", default=None, help="where the score history is kept")
+    parser.add_argument("--metrics", default=None,
+                        help="write stage timings and counters here after each build (*.prom = Prometheus textfile, "
+                             "anything else = JSON)")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="-v: progress messages, -vv: every parse and merge decision")
+    args = parser.parse_args()
+    logging.basicConfig(format="%(message)s",
+                        level=[logging.WARNING, logging.INFO, logging.DEBUG][min(args.verbose, 2)])
+    cache = None if args.no_cache else FetchCache(args.cache_dir, max_age=args.max_age, offline=args.offline)
+    build_state = BuildState(args.state_dir) if args.incremental else None
+    registry = AliasRegistry(args.aliases) if args.aliases else None
+    history = None
+    if args.history:
+        # numpy is only loaded when history is on
+        from history import ScoreHistory, DEFAULT_HISTORY_DIR
+        history = ScoreHistory(args.history_dir or DEFAULT_HISTORY_DIR)
+    score_cache = None
+    if args.score_cache:
+        from score_cache import ScoreCache, DEFAULT_SCORE_CACHE
+        score_cache = ScoreCache(args.score_cache_file or DEFAULT_SCORE_CACHE)
+
     # Example usage with custom rounds configuration
     # You can pass rounds_config to customize which rounds to include
     # Format: (round_number, round_name, url, team_col, score_col)
+    # or (round_number, round_name, url, team_col, score_col, table) to pick a table by number or heading
 
     # Default behavior (if you don't pass rounds_config):
     rounds = [
@@ -162,7 +163,33 @@ if __name__ == "__main__":
              "https://raw.githubusercontent.com/husarion/erc2025/refs/heads/main/phase_6/social_excellence.md",
              "Team name", "Point count"),
         ]
-    generate_leaderboard(rounds)
+    mirror = args.mirror if not args.mirror or args.mirror.endswith("/") else args.mirror + "/"
+    if args.source_dir or args.source_git:
+        mirror = local_base(args.source_dir, args.source_git)
+    rounds = expand_rounds(rounds)
+    if mirror:
+        rounds = [(num, name, url.replace(UPSTREAM_BASE, mirror)) + tuple(rest) for num, name, url, *rest in rounds]
+
+    if args.watch:
+        live = LivePage()
+
+        def rebuild(sources):
+            generate_leaderboard(rounds, cache=cache, registry=registry, page_size=args.page_size, export=args.export,
+                                 build_state=BuildState(args.state_dir) if args.incremental else None,
+                                 sources=sources, history=history, live=live, score_cache=score_cache,
+                                 workers=args.workers)
+            if args.metrics:
+                metrics.write(args.metrics)
+            # Polls between rebuilds count towards the next one
+            metrics.reset()
+
+        watch(rounds, rebuild, interval=args.interval, cache=cache)
+    else:
+        generate_leaderboard(rounds, cache=cache, build_state=build_state, registry=registry,
+                             page_size=args.page_size, export=args.export, history=history,
+                             score_cache=score_cache, workers=args.workers)
+        if args.metrics:
+            metrics.write(args.metrics)
 
     # Or customize like this:
     # custom_rounds = [
@@ -170,3 +197,10 @@ if __name__ == "__main__":
     #     (2, "Technical Challenge", "https://example.com/round2.md", "Team name", "Score"),
     # ]
     # generate_leaderboard(custom_rounds)
+    #
+    # Several columns (or tables) of one document, fetched and parsed once:
+    # reports = ("https://example.com/reports.md", [
+    #     (6, "Challenge 1 Report", "Team", "Challenge 1"),
+    #     (9, "Challenge 2 Report", "Team", "Challenge 2"),
+    # ])
+    # generate_leaderboard([custom_rounds[0], reports])
@@ -0,0 +1,89 @@
+import argparse
+import email.utils
+import hashlib
+import http.server
+import os
+import threading
+from functools import partial
+
+
+class ResultsHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Static file handler that behaves like raw.githubusercontent.com for our
+    purposes: strong ETags, Last-Modified, and 304 on conditional requests.
+    """
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            return super().send_head()
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        last_modified = email.utils.formatdate(os.path.getmtime(path), usegmt=True)
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return None
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        return _BytesReader(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _BytesReader:
+    """
+    Minimal file-like object so SimpleHTTPRequestHandler can copy the body
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+    def read(self, size=-1):
+        data, self.data = self.data, b""
+        return data
+
+    def close(self):
+        pass
+
+
+def start_server(directory, host="127.0.0.1", port=0, verbose=False):
+    """
+    Serve directory in a background thread. port=0 picks a free port.
+    Returns (server, base_url); call server.shutdown() to stop it.
+    """
+    handler = partial(ResultsHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer((host, port), handler)
+    server.verbose = verbose
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local copy of the results files")
+    parser.add_argument("directory", help="directory laid out like the upstream repo (phase_1/..., phase_2/...)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server, base_url = start_server(args.directory, args.host, args.port, verbose=True)
+    print(f"Serving {args.directory} at {base_url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
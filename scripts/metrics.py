@@ -0,0 +1,98 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PROMETHEUS_PREFIX = "erc_leaderboard"
+
+
+class Metrics:
+    """
+    Wall time per build stage and plain counters, cheap enough to leave on.
+
+    stage(name) accumulates seconds and calls, so a stage that runs several
+    times in one build (or across threads) adds up. Counters are integers
+    keyed by name, e.g. bytes_fetched, rows_parsed, fuzzy_comparisons.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                seconds, calls = self.stages.get(name, (0.0, 0))
+                self.stages[name] = (seconds + elapsed, calls + 1)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, snapshot):
+        """
+        Add a snapshot() taken elsewhere, e.g. in a worker process
+        """
+        with self._lock:
+            for name, stage in snapshot["stages"].items():
+                seconds, calls = self.stages.get(name, (0.0, 0))
+                self.stages[name] = (seconds + stage["seconds"], calls + stage["calls"])
+            for name, value in snapshot["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+            self.counters = {}
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "stages": {name: {"seconds": seconds, "calls": calls}
+                           for name, (seconds, calls) in self.stages.items()},
+                "counters": dict(self.counters),
+            }
+
+    def to_prometheus(self):
+        """
+        Prometheus text exposition format, for node_exporter's textfile collector
+        """
+        data = self.snapshot()
+        lines = [f"# TYPE {PROMETHEUS_PREFIX}_stage_seconds gauge"]
+        for name, stage in sorted(data["stages"].items()):
+            lines.append(f'{PROMETHEUS_PREFIX}_stage_seconds{{stage="{name}"}} {stage["seconds"]:.6f}')
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_stage_calls gauge")
+        for name, stage in sorted(data["stages"].items()):
+            lines.append(f'{PROMETHEUS_PREFIX}_stage_calls{{stage="{name}"}} {stage["calls"]}')
+        for name, value in sorted(data["counters"].items()):
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{name} gauge")
+            lines.append(f"{PROMETHEUS_PREFIX}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """
+        Write the metrics to path: Prometheus text for *.prom, JSON otherwise.
+        Written to a temp file and renamed so a scraper never reads half a file.
+        """
+        if path.endswith(".prom"):
+            text = self.to_prometheus()
+        else:
+            text = json.dumps(self.snapshot(), indent=2, sort_keys=True) + "\n"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+
+# Process-wide instance, the way logging has one root logger
+metrics = Metrics()
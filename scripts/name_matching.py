@@ -0,0 +1,311 @@
+import logging
+import math
+from collections import Counter
+
+from rapidfuzz import process, fuzz
+
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+HIGH_CONFIDENCE = 95
+GENERIC_WORDS = frozenset({'team', 'robotics', 'robot', 'rover', 'mars', 'club', 'group'})
+
+# Below this many candidates a plain loop beats the cdist call overhead
+CDIST_MIN_BATCH = 32
+GRAM = 3
+
+
+def _min_gram_overlap(length):
+    """
+    Smallest number of shared 3-grams two sorted-token strings can have
+    when one of them is `length` long and their ratio is >= HIGH_CONFIDENCE.
+    Uses the q-gram lemma: every insertion/deletion destroys at most GRAM grams.
+    """
+    best = None
+    for other in range(max(1, int(length * 0.85)), int(length * 1.2) + 3):
+        total = length + other
+        # ratio = 100 * (1 - indel / total) and indel >= |length - other|
+        if 200 * min(length, other) / total < HIGH_CONFIDENCE - 1e-9:
+            continue
+        max_indel = math.floor(total * (100 - HIGH_CONFIDENCE) / 100 + 1e-9)
+        overlap = max(length, other) - GRAM + 1 - GRAM * max_indel
+        best = overlap if best is None else min(best, overlap)
+    return best
+
+
+class _Name:
+    """
+    Everything about one unique name that the matcher needs, computed once
+    """
+
+    __slots__ = ("name", "lower", "words", "sorted_text", "rare_words", "rare_grams")
+
+    def __init__(self, name):
+        self.name = name
+        self.lower = name.lower().strip()
+        self.words = frozenset(self.lower.split())
+        # token_sort_ratio(a, b) == ratio(sorted tokens of a, sorted tokens of b)
+        self.sorted_text = " ".join(sorted(self.lower.split()))
+        self.rare_words = None
+        self.rare_grams = None
+
+
+def _grams(text):
+    # Each occurrence of a gram is its own token, so set overlap equals multiset overlap
+    seen = {}
+    grams = []
+    for i in range(len(text) - GRAM + 1):
+        gram = text[i:i + GRAM]
+        occurrence = seen.get(gram, 0)
+        grams.append((gram, occurrence))
+        seen[gram] = occurrence + 1
+    return grams
+
+
+class _CanonicalIndex:
+    """
+    Inverted indexes over the current canonical names, used to pick the only
+    canonicals that can possibly satisfy one of the merge rules.
+
+    Prefix filtering: words/grams are ordered globally from rarest to most common,
+    and two sets sharing at least o tokens must share one among the first |set| - o + 1
+    of each. Very common words like "team" therefore rarely end up in a prefix.
+    """
+
+    def __init__(self, names):
+        all_grams = [_grams(n.sorted_text) for n in names]
+        word_freq = Counter(word for n in names for word in n.words)
+        gram_freq = Counter(gram for grams in all_grams for gram in grams)
+        for n, grams in zip(names, all_grams):
+            n.rare_words = sorted(n.words, key=lambda w: (word_freq[w], w))
+            grams.sort(key=lambda g: (gram_freq[g], g))
+            min_overlap = _min_gram_overlap(len(n.sorted_text)) if grams else None
+            if min_overlap is None or min_overlap <= 0:
+                n.rare_grams = grams
+            else:
+                n.rare_grams = grams[:len(grams) - min_overlap + 1]
+
+        self.by_word = {}  # every word of a canonical -> slots
+        self.by_rarest_word = {}  # rarest word of a canonical -> slots
+        self.by_pair_prefix = {}  # prefix for ">= 2 common words" -> slots
+        self.by_gram_prefix = {}  # prefix for ">= 95 score" -> slots
+        self.by_sorted_text = {}  # exact sorted-token text -> slots
+
+    @staticmethod
+    def _add(index, key, slot):
+        index.setdefault(key, set()).add(slot)
+
+    @staticmethod
+    def _discard(index, key, slot):
+        slots = index.get(key)
+        if slots is not None:
+            slots.discard(slot)
+            if not slots:
+                del index[key]
+
+    def _entries(self, n):
+        for word in n.words:
+            yield self.by_word, word
+        yield self.by_rarest_word, n.rare_words[0]
+        for word in n.rare_words[:len(n.rare_words) - 1]:
+            yield self.by_pair_prefix, word
+        for gram in n.rare_grams:
+            yield self.by_gram_prefix, gram
+        yield self.by_sorted_text, n.sorted_text
+
+    def add(self, n, slot):
+        for index, key in self._entries(n):
+            self._add(index, key, slot)
+
+    def remove(self, n, slot):
+        for index, key in self._entries(n):
+            self._discard(index, key, slot)
+
+    def first_subset(self, n, canonical):
+        """
+        Lowest slot whose words are a subset or superset of n's words, or None
+        """
+        # n inside canonical: the canonical holds every one of n's words
+        postings = sorted((self.by_word.get(word, set()) for word in n.words), key=len)
+        found = set(postings[0]).intersection(*postings[1:])
+        # canonical inside n: the canonical's rarest word is one of n's words
+        for word in n.words:
+            for slot in self.by_rarest_word.get(word, ()):
+                if canonical[slot].words <= n.words:
+                    found.add(slot)
+        return min(found) if found else None
+
+    def candidates(self, n, below=None):
+        """
+        Slots (ascending, under `below` if given) of canonicals that could pass
+        the score or threshold rules with n
+        """
+        found = set()
+        # Threshold rule needs >= 2 common words
+        for word in n.rare_words[:len(n.rare_words) - 1]:
+            found |= self.by_pair_prefix.get(word, set())
+        # High-confidence score can happen without any shared word (typos)
+        for gram in n.rare_grams:
+            found |= self.by_gram_prefix.get(gram, set())
+        found |= self.by_sorted_text.get(n.sorted_text, set())
+        if below is not None:
+            return sorted(slot for slot in found if slot < below) + [below]
+        return sorted(found)
+
+
+def _scores(query, choices, cutoff, workers):
+    """
+    Scores of query against choices, 0 for anything below cutoff
+    """
+    if len(choices) < CDIST_MIN_BATCH:
+        return [fuzz.ratio(query, choice, score_cutoff=cutoff) for choice in choices]
+    # cdist hands back a numpy array anyway; only large batches get here.
+    # float64 keeps the scores identical to fuzz.ratio (the default is float32)
+    import numpy as np
+
+    return process.cdist([query], choices, scorer=fuzz.ratio, dtype=np.float64,
+                         score_cutoff=cutoff, workers=workers)[0].tolist()
+
+
+def _cached_scores(query, choices, workers, score_cache):
+    """
+    Scores of query against choices without a cutoff, through a ScoreCache:
+    only pairs not seen before are scored, all in one batch
+    """
+    scores = score_cache.lookup(query, choices)
+    missing = [k for k, score in enumerate(scores) if score is None]
+    if missing:
+        missing_choices = [choices[k] for k in missing]
+        fresh = _scores(query, missing_choices, 0, workers)
+        score_cache.update(query, missing_choices, fresh)
+        for k, score in zip(missing, fresh):
+            scores[k] = score
+    metrics.count("score_cache_hits", len(choices) - len(missing))
+    metrics.count("score_cache_misses", len(missing))
+    return scores
+
+
+def score_matrix(teams, workers=1, score_cache=None):
+    """
+    Square list of the fuzz.ratio scores the matcher would compute between
+    every two of these names (token-sorted, lowercased), for auditing merges
+    """
+    texts = [_Name(team).sorted_text for team in teams]
+    if score_cache is None:
+        return [_scores(text, texts, 0, workers) for text in texts]
+    return [_cached_scores(text, texts, workers, score_cache) for text in texts]
+
+
+def match_team_names(sorted_teams, threshold=85, workers=1, frozen=(), score_cache=None):
+    """
+    Map each name to its canonical team, in the given priority order.
+
+    Applies exactly the merge rules of the original pairwise loop (>= 95 score,
+    word subset, threshold + shared words + generic-word guard, longer name wins),
+    but only scores the canonicals the indexes say could match.
+    workers: cores used by rapidfuzz when a name has many candidates (-1 = all)
+    frozen: canonical names that already exist; they take the first slots and
+            are never renamed to a longer variant
+    score_cache: ScoreCache; pairs scored in earlier builds are looked up
+                 instead of scored again
+    Returns (mapping, canonical_names)
+    """
+    frozen_names = [_Name(team) for team in frozen]
+    names = [_Name(team) for team in sorted_teams]
+    index = _CanonicalIndex(frozen_names + names)
+
+    # Merge decisions are logged per name; skip building the messages unless someone reads them
+    debug = logger.isEnabledFor(logging.DEBUG)
+    comparisons = 0
+    canonical = []  # slot -> _Name currently holding that canonical
+    slot_of = {}  # team -> slot
+    for slot, n in enumerate(frozen_names):
+        canonical.append(n)
+        index.add(n, slot)
+
+    for n in names:
+        team = n.name
+        if not canonical:
+            # First team becomes canonical
+            canonical.append(n)
+            index.add(n, 0)
+            slot_of[team] = 0
+            if debug:
+                logger.debug("Set canonical: '%s'", team)
+            continue
+
+        # The loop stops at the first subset match, so later canonicals never matter
+        subset_slot = index.first_subset(n, canonical)
+        slots = index.candidates(n, below=subset_slot)
+        comparisons += len(slots)
+        # Scores under both thresholds cannot change the outcome
+        choices = [canonical[slot].sorted_text for slot in slots]
+        if score_cache is None:
+            scores = _scores(n.sorted_text, choices, min(threshold, HIGH_CONFIDENCE), workers)
+            if subset_slot is not None:
+                scores[-1] = fuzz.ratio(n.sorted_text, choices[-1])
+        else:
+            exact = _cached_scores(n.sorted_text, choices, workers, score_cache)
+            cutoff = min(threshold, HIGH_CONFIDENCE)
+            scores = [score if score >= cutoff else 0 for score in exact]
+            if subset_slot is not None:
+                scores[-1] = exact[-1]
+
+        best_slot = None
+        best_score = 0
+        for slot, score in zip(slots, scores):
+            if not score and slot != subset_slot:
+                continue
+            c = canonical[slot]
+            team_words = n.words
+            canonical_words = c.words
+
+            # High confidence matches
+            if score >= HIGH_CONFIDENCE:
+                best_slot, best_score = slot, score
+                break
+
+            # Subset matching - one name contains all words of the other
+            elif slot == subset_slot:
+                best_slot, best_score = slot, score
+                if debug:
+                    logger.debug("Subset match: '%s' <-> '%s' (words: %s <-> %s)",
+                                 team, c.name, set(team_words), set(canonical_words))
+                break
+
+            # Moderate confidence with word overlap check
+            elif score >= threshold:
+                common_words = team_words & canonical_words
+                min_words = min(len(team_words), len(canonical_words))
+                if len(common_words) >= 2 and len(common_words) >= min_words * 0.7:
+                    # Extra safety: avoid merging if one name is very generic
+                    if not (team_words <= GENERIC_WORDS or canonical_words <= GENERIC_WORDS):
+                        if score > best_score:
+                            best_slot, best_score = slot, score
+
+        if best_slot is not None:
+            best_match = canonical[best_slot]
+            slot_of[team] = best_slot
+            # Choose the more complete/longer name as canonical; every name
+            # in the slot follows automatically
+            if len(team) > len(best_match.name) and best_slot >= len(frozen_names):
+                index.remove(best_match, best_slot)
+                canonical[best_slot] = n
+                index.add(n, best_slot)
+                if debug:
+                    logger.debug("Updated canonical '%s' -> '%s' (score: %s)", best_match.name, team, best_score)
+            elif debug:
+                logger.debug("Merged '%s' -> '%s' (score: %s)", team, best_match.name, best_score)
+        else:
+            # No good match found, add as new canonical
+            slot_of[team] = len(canonical)
+            index.add(n, len(canonical))
+            canonical.append(n)
+            if debug:
+                logger.debug("New canonical: '%s' (no matches found)", team)
+
+    metrics.count("names_matched", len(names))
+    metrics.count("fuzzy_comparisons", comparisons)
+    mapping = {team: canonical[slot].name for team, slot in slot_of.items()}
+    return mapping, [c.name for c in canonical[len(frozen_names):]]
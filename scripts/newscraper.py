@@ -1,9 +1,26 @@
-import requests
-import pandas as pd
-from rapidfuzz import process, fuzz
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# requests, pandas and rapidfuzz are imported where they are needed: together they
+# take longer to import than a whole build of a normal-sized board takes to run
+from fetch_cache import content_hash
+from board import Board, assemble_board
+from sources import is_local, read_local_sources
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
 
 
 def extract_markdown_table(md_text, team_col, score_col):
+    import pandas as pd
+
     lines = md_text.strip().splitlines()
     table_started = False
     table_lines = []
@@ -14,7 +31,7 @@ def extract_markdown_table(md_text, team_col, score_col):
                 "|") and team_col.lower() in line.lower() and score_col.lower() in line.lower():
             table_started = True
             table_lines.append(line)
-            print(f"Found table header at line {i}: {line.strip()}")
+            logger.debug("Found table header at line %d: %s", i, line.strip())
         elif table_started and line.strip().startswith("|"):
             # Skip the separator line (usually contains dashes)
             if not all(c in "|-: " for c in line.strip()):
@@ -27,20 +44,21 @@ def extract_markdown_table(md_text, team_col, score_col):
             break
 
     if len(table_lines) < 2:
-        print(f"Looking for columns: '{team_col}' and '{score_col}'")
-        # Debug: show lines that contain pipe characters
-        pipe_lines = [f"Line {i}: {line.strip()}" for i, line in enumerate(lines) if "|" in line]
-        print(f"Lines with pipes: {pipe_lines[:5]}")
+        logger.debug("Looking for columns: '%s' and '%s'", team_col, score_col)
+        if logger.isEnabledFor(logging.DEBUG):
+            # Debug: show lines that contain pipe characters
+            pipe_lines = [f"Line {i}: {line.strip()}" for i, line in enumerate(lines) if "|" in line]
+            logger.debug("Lines with pipes: %s", pipe_lines[:5])
         return None
 
-    print(f"Extracted {len(table_lines)} table lines")
+    logger.debug("Extracted %d table lines", len(table_lines))
 
     # Build list of rows - Handle empty cells properly
     data = []
     # Parse headers - keep empty cells
     header_parts = table_lines[0].split("|")
     headers = [h.strip() for h in header_parts[1:-1]]  # Remove first and last empty parts
-    print(f"Headers found: {headers}")
+    logger.debug("Headers found: %s", headers)
 
     for row_idx, row in enumerate(table_lines[1:], 1):
         # Parse row values - keep empty cells
@@ -50,125 +68,279 @@ def extract_markdown_table(md_text, team_col, score_col):
         if len(values) == len(headers):
             data.append(values)
         else:
-            print(f"⚠Row {row_idx} has {len(values)} values but expected {len(headers)}")
-            print(f"Raw row: {row}")
-            print(f"Parsed values: {values}")
+            logger.debug("Row %d has %d values but expected %d", row_idx, len(values), len(headers))
+            logger.debug("Raw row: %s", row)
+            logger.debug("Parsed values: %s", values)
             # Try to pad with empty strings if we have fewer values
             while len(values) < len(headers):
                 values.append("")
             data.append(values)
 
     if not data:
-        print("Table rows not extracted properly")
+        logger.debug("Table rows not extracted properly")
         return None
 
-    print(f"Successfully extracted {len(data)} data rows")
+    logger.debug("Successfully extracted %d data rows", len(data))
 
     try:
         df = pd.DataFrame(data, columns=headers)
-        print(f"DataFrame created with shape: {df.shape}")
-        print(f"Columns: {list(df.columns)}")
-        # Show first few rows for debugging
-        print("First few rows:")
-        print(df.head())
+        logger.debug("DataFrame created with shape: %s", df.shape)
+        logger.debug("Columns: %s", list(df.columns))
+        if logger.isEnabledFor(logging.DEBUG):
+            # Show first few rows for debugging
+            logger.debug("First few rows:\n%s", df.head())
         return df
     except Exception as e:
-        print(f"Failed to create DataFrame: {e}")
+        logger.warning("Failed to create DataFrame: %s", e)
         return None
 
 
-def normalize_team_names(team_list, threshold=85):
+def parse_score(text):
     """
-    Normalize team names using smart fuzzy matching
+    Same result as pd.to_numeric(errors="coerce").fillna(0) on a single cell
+    """
+    if not text.isascii() or "_" in text:
+        return 0
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        value = float(text)
+    except ValueError:
+        return 0
+    return 0 if value != value else value  # NaN -> 0
+
+
+def iter_text_lines(text):
+    """
+    Lines of an in-memory document, produced lazily without copying the whole text
+    """
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def scan_tables(lines):
+    """
+    Single pass over a whole document (an iterable of str or bytes lines) that
+    keeps every table in it, so any number of columns and tables can be read
+    from one fetch and one parse.
+
+    Returns one block per run of table lines (blank lines do not end a run, any
+    other line does) as (heading, lines, starts): the last markdown heading above
+    the block, its stripped table lines without |---| separators, and the indices
+    in lines where a table header (a line followed by a separator) starts.
+    """
+    blocks = []
+    heading = None
+    current = starts = None
+    after_separator = True
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped[0] != "|":
+            current = None
+            if stripped[0] == "#":
+                heading = stripped.lstrip("#").strip()
+            continue
+        if current is None:
+            current, starts = [], []
+            blocks.append((heading, current, starts))
+        if not stripped.strip("|-: "):
+            # The line above was a header, unless two separators follow each other
+            if current and not after_separator:
+                starts.append(len(current) - 1)
+            after_separator = True
+            continue
+        after_separator = False
+        current.append(stripped)
+    return blocks
+
+
+def _read_columns(header, rows, team_col, score_col):
+    """
+    (teams, scores) of two columns of a table: teams as str, scores as numbers
+    (unparseable -> 0). Rows without a team name are dropped.
+    """
+    headers = [h.strip() for h in header.split("|")[1:-1]]
+    if team_col not in headers or score_col not in headers:
+        return None
+    team_idx = headers.index(team_col)
+    score_idx = headers.index(score_col)
+    width = len(headers)
+    teams = []
+    scores = []
+    # Cell k of a row is split("|")[k + 1]: the row starts and ends with a pipe
+    team_idx += 1
+    score_idx += 1
+    for row in rows:
+        values = row.split("|")
+        cells = len(values) - 1
+        if cells > width + 1:
+            # The old DataFrame-based parser rejects the whole table here
+            return None
+        # Short rows are padded with empty cells
+        team = values[team_idx].strip() if team_idx < cells else ""
+        score = values[score_idx].strip() if score_idx < cells else ""
+        if team:
+            teams.append(team)
+            scores.append(parse_score(score))
+    if not teams:
+        return None
+    return teams, scores
+
+
+def _table_rows(lines):
+    """
+    Stripped rows of the table a line iterator is in, without separators,
+    up to (and consuming) the first non-table line
     """
-    canonical = []
-    mapping = {}
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped[0] != "|":
+            return
+        if stripped.strip("|-: "):
+            yield stripped
+
+
+def stream_table(lines, team_col, score_col):
+    """
+    Two columns of the first table naming both, as (teams, scores) or None:
+    the same result as read_table(scan_tables(lines), team_col, score_col),
+    in one pass that fills the two columns directly and stops reading at the
+    end of that table. lines: any iterable of str or bytes lines, such as a
+    file, response.iter_lines() or iter_text_lines().
+    """
+    team_lower = team_col.lower()
+    score_lower = score_col.lower()
+    lines = iter(lines)
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        stripped = line.strip()
+        if not stripped or stripped[0] != "|" or not stripped.strip("|-: "):
+            continue
+        lowered = stripped.lower()
+        if team_lower in lowered and score_lower in lowered:
+            return _read_columns(stripped, _table_rows(lines), team_col, score_col)
+    return None
+
+
+def read_table(blocks, team_col, score_col, table=None):
+    """
+    Two columns of one table of a scan_tables() result, as (teams, scores) or None.
+
+    table: None   the first table line naming both columns is the header, and rows
+                  run until the first non-table line (the original lookup)
+           int    the n-th table of the document, counting from 1
+           str    the first table with both columns under a heading containing this text
+    """
+    if table is None:
+        team_lower = team_col.lower()
+        score_lower = score_col.lower()
+        for _, lines, _ in blocks:
+            for k, line in enumerate(lines):
+                lowered = line.lower()
+                if team_lower in lowered and score_lower in lowered:
+                    return _read_columns(line, lines[k + 1:], team_col, score_col)
+        return None
+
+    tables = []
+    for heading, lines, starts in blocks:
+        for k, start in enumerate(starts):
+            stop = starts[k + 1] if k + 1 < len(starts) else len(lines)
+            tables.append((heading, lines[start], lines[start + 1:stop]))
+    if isinstance(table, int):
+        if not 1 <= table <= len(tables):
+            return None
+        _, header, rows = tables[table - 1]
+        return _read_columns(header, rows, team_col, score_col)
+    wanted = table.lower()
+    for heading, header, rows in tables:
+        if heading is not None and wanted in heading.lower():
+            columns = _read_columns(header, rows, team_col, score_col)
+            if columns is not None:
+                return columns
+    return None
+
+
+def round_source(round_cfg):
+    """
+    (url, team_col, score_col, table) of a round tuple; table is None unless given as a 6th element
+    """
+    url, team_col, score_col = round_cfg[2:5]
+    return url, team_col, score_col, round_cfg[5] if len(round_cfg) > 5 else None
+
+
+def expand_rounds(rounds_config):
+    """
+    Round tuples of a config that may also group rounds by document:
+    (url, [(round_num, round_name, team_col, score_col[, table]), ...]) reads
+    several columns or tables of one document, which is fetched and parsed once
+    """
+    rounds = []
+    for entry in rounds_config:
+        if len(entry) == 2:
+            url, outputs = entry
+            rounds.extend((output[0], output[1], url) + tuple(output[2:]) for output in outputs)
+        else:
+            rounds.append(tuple(entry))
+    return rounds
+
 
+def normalize_team_names(team_list, threshold=85, workers=1, registry=None, score_cache=None):
+    """
+    Normalize team names using smart fuzzy matching
+    workers: cores rapidfuzz may use for large candidate batches (-1 = all)
+    registry: AliasRegistry; names it already knows skip fuzzy matching entirely
+    score_cache: ScoreCache; name pairs scored by earlier builds are not scored again
+    """
     # Remove empty/null team names
     clean_teams = [team.strip() for team in team_list if team and str(team).strip()]
-    unique_teams = list(set(clean_teams))
+    team_counts = Counter(clean_teams)
+    unique_teams = list(team_counts)
 
-    # Sort by frequency first (most common names become canonical), then by length (longer names preferred)
-    team_counts = {team: clean_teams.count(team) for team in unique_teams}
+    # Sort by frequency first (most common names become canonical), then by length (longer names preferred).
+    # Ties keep first-appearance order so the result does not depend on set ordering.
     sorted_teams = sorted(unique_teams, key=lambda x: (-team_counts[x], -len(x)))
 
-    for team in sorted_teams:
-        if not canonical:
-            # First team becomes canonical
-            canonical.append(team)
-            mapping[team] = team
-            print(f"Set canonical: '{team}'")
-        else:
-            best_match = None
-            best_score = 0
-            should_merge = False
-
-            for canonical_name in canonical:
-                team_lower = team.lower().strip()
-                canonical_lower = canonical_name.lower().strip()
-
-                # Get fuzzy match score
-                score = fuzz.token_sort_ratio(team_lower, canonical_lower)
-
-                # Check for exact subset matches (handles "Team X" vs "X" cases)
-                team_words = set(team_lower.split())
-                canonical_words = set(canonical_lower.split())
-
-                # High confidence matches
-                if score >= 95:
-                    should_merge = True
-                    best_match = canonical_name
-                    best_score = score
-                    break
-
-                # Subset matching - one name contains all words of the other
-                elif (team_words.issubset(canonical_words) or canonical_words.issubset(team_words)):
-                    # Additional check: make sure they share significant content
-                    if len(team_words & canonical_words) >= min(len(team_words), len(canonical_words)):
-                        should_merge = True
-                        best_match = canonical_name
-                        best_score = score
-                        print(
-                            f"Subset match: '{team}' <-> '{canonical_name}' (words: {team_words} <-> {canonical_words})")
-                        break
-
-                # Moderate confidence with word overlap check
-                elif score >= threshold:
-                    common_words = team_words & canonical_words
-                    # Require at least 2 common words AND those words make up most of the shorter name
-                    min_words = min(len(team_words), len(canonical_words))
-                    if len(common_words) >= 2 and len(common_words) >= min_words * 0.7:
-                        # Extra safety: avoid merging if one name is very generic
-                        generic_words = {'team', 'robotics', 'robot', 'rover', 'mars', 'club', 'group'}
-                        if not (team_words.issubset(generic_words) or canonical_words.issubset(generic_words)):
-                            if score > best_score:
-                                should_merge = True
-                                best_match = canonical_name
-                                best_score = score
-
-            if should_merge and best_match:
-                # Choose the more complete/longer name as canonical
-                if len(team) > len(best_match):
-                    # Replace the canonical name with the longer version
-                    canonical_idx = canonical.index(best_match)
-                    canonical[canonical_idx] = team
-                    # Update all existing mappings that pointed to the old canonical
-                    for k, v in mapping.items():
-                        if v == best_match:
-                            mapping[k] = team
-                    mapping[team] = team
-                    print(f"Updated canonical '{best_match}' -> '{team}' (score: {best_score})")
-                else:
-                    mapping[team] = best_match
-                    print(f"Merged '{team}' -> '{best_match}' (score: {best_score})")
+    if registry is None:
+        from name_matching import match_team_names
+        mapping, canonical = match_team_names(sorted_teams, threshold=threshold, workers=workers,
+                                              score_cache=score_cache)
+    else:
+        mapping = {}
+        new_teams = []
+        for team in sorted_teams:
+            known = registry.resolve(team)
+            if known is None:
+                new_teams.append(team)
             else:
-                # No good match found, add as new canonical
-                canonical.append(team)
-                mapping[team] = team
-                if best_match:
-                    print(f" New canonical: '{team}' (rejected match: '{best_match}', score: {best_score})")
-                else:
-                    print(f"New canonical: '{team}' (no matches found)")
+                mapping[team] = known
+        logger.info("Alias registry resolved %d/%d names, %d new", len(mapping), len(sorted_teams), len(new_teams))
+        metrics.count("alias_hits", len(mapping))
+        if new_teams:
+            # New names can join an existing team but never rename it
+            from name_matching import match_team_names
+            new_mapping, _ = match_team_names(new_teams, threshold=threshold, workers=workers,
+                                              frozen=registry.canonical_names(), score_cache=score_cache)
+            registry.learn(new_mapping)
+            mapping.update((team, registry.pinned(name)) for team, name in new_mapping.items())
+        mapping = {team: registry.display_name(name) for team, name in mapping.items()}
+        canonical = set(mapping.values())
 
     # Apply mapping to all original teams (including duplicates)
     final_mapping = {}
@@ -179,16 +351,206 @@ def normalize_team_names(team_list, threshold=85):
         else:
             final_mapping[team] = team  # Keep empty/null values as-is
 
-    print(f"Normalization complete: {len(unique_teams)} unique -> {len(canonical)} canonical")
+    logger.info("Normalization complete: %d unique -> %d canonical", len(unique_teams), len(canonical))
     return final_mapping
 
 
-def get_leaderboard_dataframe(rounds_config=None):
-    '''
+def make_session(pool_size=8):
+    """
+    Shared keep-alive session so repeated fetches reuse connections
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
 
-    ROUND NUMBER + URL + COLUMN HEADINGS
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
 
-    '''
+
+def _is_transient(error):
+    """
+    True for failures a cached copy can stand in for: the connection failed or
+    timed out, the server erred (5xx) or asked us to slow down (429). A 404/410
+    means the file moved or was removed, which the build has to report.
+    """
+    import requests
+
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is not None and (status >= 500 or status == 429)
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def fetch_round_sources(rounds_config, max_workers=8, per_host_limit=4, timeout=30, session=None, cache=None):
+    """
+    Fetch the markdown of every round concurrently.
+    Returns a list of (md_text, error) tuples in the same order as rounds_config,
+    so callers see exactly what the old sequential loop produced.
+    With a FetchCache, requests are conditional and cached bodies are reused.
+    file:// and git: URLs are read locally and never cached.
+    A URL listed by several rounds is fetched once.
+    """
+    if not rounds_config:
+        return []
+
+    rounds_config = expand_rounds(rounds_config)
+    urls = [round_cfg[2] for round_cfg in rounds_config]
+    first = {}
+    for round_cfg in rounds_config:
+        first.setdefault(round_cfg[2], round_cfg)
+    if len(first) < len(urls):
+        fetched = dict(zip(first, fetch_round_sources(list(first.values()), max_workers=max_workers,
+                                                      per_host_limit=per_host_limit, timeout=timeout,
+                                                      session=session, cache=cache)))
+        return [fetched[url] for url in urls]
+
+    local_urls = [url for url in urls if is_local(url)]
+    if local_urls:
+        with metrics.stage("fetch"):
+            local_sources = dict(zip(local_urls, read_local_sources(local_urls)))
+        metrics.count("local_reads", len(local_urls))
+        remote = [round_cfg for round_cfg in rounds_config if not is_local(round_cfg[2])]
+        fetched = iter(fetch_round_sources(remote, max_workers=max_workers, per_host_limit=per_host_limit,
+                                           timeout=timeout, session=session, cache=cache))
+        return [local_sources[url] if is_local(url) else next(fetched) for url in urls]
+
+    max_workers = max(1, min(max_workers, len(rounds_config)))
+    own_session = session is None
+    # Created on first use, so cache-only builds never import requests
+    session_lock = threading.Lock()
+    sessions = [session]
+
+    def get_session():
+        with session_lock:
+            if sessions[0] is None:
+                sessions[0] = make_session(pool_size=max_workers)
+            return sessions[0]
+
+    # One semaphore per host caps how many requests hit the same server at once
+    host_limits = {}
+    for url in urls:
+        host = urlsplit(url).netloc
+        if host not in host_limits:
+            host_limits[host] = threading.BoundedSemaphore(max(1, per_host_limit))
+
+    def fetch_one(round_cfg):
+        round_num, round_name, url = round_cfg[:3]
+        entry = cache.lookup(url) if cache is not None else None
+        if cache is not None:
+            if cache.offline:
+                if entry is None:
+                    return None, LookupError(f"{url} is not cached and offline mode is on")
+                logger.info("Offline: using cached %s", round_name)
+                metrics.count("cache_hits")
+                cache.touch(url)
+                return entry["body"], None
+            if entry is not None and cache.is_fresh(entry):
+                logger.info("Cache fresh: using cached %s", round_name)
+                metrics.count("cache_hits")
+                cache.touch(url)
+                return entry["body"], None
+
+        logger.info("Fetching %s (Round %s) from: %s", round_name, round_num, url)
+        try:
+            headers = cache.conditional_headers(entry) if entry is not None else None
+            with host_limits[urlsplit(url).netloc]:
+                response = get_session().get(url, timeout=timeout, headers=headers)
+            metrics.count("http_requests")
+            metrics.count("bytes_fetched", len(response.content))
+            if response.status_code == 304 and entry is not None:
+                logger.info("Not modified: reusing cached %s", round_name)
+                metrics.count("cache_hits")
+                cache.touch(url, revalidated=True)
+                return entry["body"], None
+            response.raise_for_status()  # Raise an exception for bad status codes
+            logger.info("Successfully fetched %s (Status: %d)", round_name, response.status_code)
+            if cache is not None:
+                metrics.count("cache_misses")
+                cache.store(url, response.text,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"))
+            return response.text, None
+        except Exception as e:
+            if entry is not None and _is_transient(e):
+                # A flaky upstream should not wipe the round off the board
+                logger.warning("Fetch failed for %s (%s), falling back to cached copy", round_name, e)
+                metrics.count("cache_stale_fallbacks")
+                cache.touch(url)
+                return entry["body"], None
+            return None, e
+
+    try:
+        with metrics.stage("fetch"), ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # map() yields in submission order regardless of completion order
+            return list(pool.map(fetch_one, rounds_config))
+    finally:
+        if own_session and sessions[0] is not None:
+            sessions[0].close()
+        if cache is not None:
+            cache.save()
+
+
+def parse_document(md_text):
+    """
+    Every table of a fetched document (scan_tables), for any number of rounds to read
+    """
+    logger.debug("Content length: %d characters", len(md_text))
+    with metrics.stage("parse"):
+        blocks = scan_tables(iter_text_lines(md_text))
+    metrics.count("documents_parsed")
+    return blocks
+
+
+def extract_round(blocks, round_name, team_col, score_col, table=None):
+    """
+    One round's cleaned (teams, scores) lists out of a parse_document() result, or None
+    """
+    with metrics.stage("parse"):
+        table = read_table(blocks, team_col, score_col, table)
+    return _found_round(table, round_name, team_col, score_col)
+
+
+def stream_round(md_text, round_name, team_col, score_col):
+    """
+    One round's cleaned (teams, scores) lists read straight from a fetched
+    document, or None: for a document no other round reads and no table
+    selector, where keeping every table of it (parse_document) is wasted work
+    """
+    logger.debug("Content length: %d characters", len(md_text))
+    with metrics.stage("parse"):
+        table = stream_table(iter_text_lines(md_text), team_col, score_col)
+    metrics.count("documents_parsed")
+    return _found_round(table, round_name, team_col, score_col)
+
+
+def _found_round(table, round_name, team_col, score_col):
+    if table is None:
+        logger.warning("Could not find valid table with %s and %s", team_col, score_col)
+        return None
+
+    metrics.count("rows_parsed", len(table[0]))
+    logger.info("%s: %d teams after cleaning", round_name, len(table[0]))
+    return table
+
+
+def build_leaderboard(rounds_config=None, max_workers=8, per_host_limit=4, cache=None, build_state=None,
+                      registry=None, sources=None, tables=None, history=None, score_cache=None, workers=1):
+    """
+    Fetch, parse, normalize and assemble every round into an (unranked) Board.
+    Needs neither pandas nor numpy for boards of ordinary size.
+
+    rounds_config: round tuples (round_num, round_name, url, team_col, score_col[, table]),
+                   or grouped by document, see expand_rounds
+    sources: already fetched (md_text, error) per round, as returned by fetch_round_sources
+    tables: already parsed rounds, {round_source(round_cfg): (teams, scores) or None}
+    history: ScoreHistory that gets a snapshot of the assembled board
+    score_cache: ScoreCache of fuzzy-match scores, kept between builds
+    workers: cores used to score name pairs in large batches (-1 = all)
+    Returns None if no round produced any data.
+    """
 
     if rounds_config is None:
         rounds_config = [
@@ -205,117 +567,130 @@ def get_leaderboard_dataframe(rounds_config=None):
              "https://raw.githubusercontent.com/husarion/erc2025/refs/heads/main/phase_6/social_excellence.md",
              "Team name", "Point count"),
         ]
+    rounds_config = expand_rounds(rounds_config)
 
-    round_dfs = []
-    all_teams = set()
-
-    for round_num, round_name, url, team_col, score_col in rounds_config:
-        print(f"Fetching {round_name} (Round {round_num}) from: {url}")
-        try:
-            # Add timeout and better error handling
-            print(f"⏳ Making HTTP request...")
-            response = requests.get(url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            response.raise_for_status()  # Raise an exception for bad status codes
-            print(f"Successfully fetched {round_name} (Status: {response.status_code})")
-
-            md_text = response.text
-            print(f"Content length: {len(md_text)} characters")
-
-            #Show first few lines of content
-            lines_preview = md_text.split('\n')[:5]
-            print(f"First few lines: {lines_preview}")
+    parsed = []  # (round_num, round_name, teams, scores) of every round with data
 
-            df = extract_markdown_table(md_text, team_col, score_col)
-            if df is None or team_col not in df.columns or score_col not in df.columns:
-                print(f"Warning: Could not find valid table with {team_col} and {score_col}")
-                continue
+    # Fetch every round up front, concurrently; results come back in config order
+    if sources is None:
+        sources = fetch_round_sources(rounds_config, max_workers=max_workers, per_host_limit=per_host_limit,
+                                      cache=cache)
 
-            df = df[[team_col, score_col]].copy()
-            df.columns = ["Team", round_name]
-            df[round_name] = pd.to_numeric(df[round_name], errors="coerce").fillna(0)
+    round_parts = []
+    reused_rounds = 0
+    # Each document is parsed once, however many rounds read from it
+    documents = {}
+    readers = Counter(round_cfg[2] for round_cfg in rounds_config)
 
-            # Remove empty team names before processing
-            df = df[df["Team"].str.strip() != ""].copy()
-            print(f"{round_name}: {len(df)} teams after cleaning")
-
-            df["_round_num"] = round_num  # Store round number for sorting
-            round_dfs.append(df)
-            all_teams.update(df["Team"].tolist())
+    for round_cfg, (md_text, error) in zip(rounds_config, sources):
+        round_num, round_name = round_cfg[:2]
+        url, team_col, score_col, table_selector = round_source(round_cfg)
+        try:
+            part = [round_num, round_name, url, team_col, score_col] + (
+                [table_selector] if table_selector is not None else [])
+            if error is not None:
+                round_parts.append(part + [None])
+                raise error
+            digest = content_hash(md_text)
+            round_parts.append(part + [digest])
+
+            table = None
+            if build_state is not None:
+                round_key = build_state.round_key(digest, round_name, team_col, score_col, table_selector)
+                table = build_state.load_round(round_key)
+
+            if table is not None:
+                reused_rounds += 1
+                metrics.count("rows_reused", len(table[0]))
+                logger.info("%s: unchanged, reusing %d cleaned rows", round_name, len(table[0]))
+            else:
+                if tables is not None and (url, team_col, score_col, table_selector) in tables:
+                    table = tables[url, team_col, score_col, table_selector]
+                elif readers[url] == 1 and table_selector is None:
+                    table = stream_round(md_text, round_name, team_col, score_col)
+                else:
+                    if url not in documents:
+                        documents[url] = parse_document(md_text)
+                    table = extract_round(documents[url], round_name, team_col, score_col, table_selector)
+                if table is None:
+                    continue
+                if build_state is not None:
+                    build_state.save_round(round_key, *table)
+
+            parsed.append((round_num, round_name) + tuple(table))
         except Exception as e:
-            print(f"Error in {round_name}: {e}")
+            logger.warning("Error in %s: %s", round_name, e)
             continue
 
-    if not round_dfs:
-        print("No valid data found across all rounds.")
-        return pd.DataFrame(columns=["Team", "Total"])
-
-    # Normalize team names
-    all_names = [name for df in round_dfs for name in df["Team"]]
-    print(f"Normalizing {len(all_names)} team name instances...")
-    name_map = normalize_team_names(all_names)
-
-    # Apply normalization to all dataframes
-    for df in round_dfs:
-        df["Team"] = df["Team"].map(lambda name: name_map.get(name, name))
-        print(f"After normalization: {df['Team'].nunique()} unique teams in {df.columns[1]}")
-
-    # Create master dataframe with all unique normalized team names
-    all_normalized_teams = set()
-    for df in round_dfs:
-        all_normalized_teams.update(df["Team"].unique())
-
-    master_df = pd.DataFrame({"Team": sorted(all_normalized_teams)})
-    print(f"Master dataframe initialized with {len(master_df)} unique teams")
-
-    # Create columns for all 7 rounds, but populate with actual round names
-    for i in range(1, 9):  # Always 7 rounds
-        matching_dfs = [df for
-                         df in round_dfs if df["_round_num"].iloc[0] == i]
-        if matching_dfs:
-            for df in matching_dfs:
-                round_col = [col for col in df.columns if col not in ["Team", "_round_num"]][0]
-                df_to_merge = df[["Team", round_col]].copy()
-
-                # Handle duplicates within the same round by summing scores
-                print(f"Before dedup in {round_col}: {len(df_to_merge)} rows")
-                if df_to_merge["Team"].duplicated().any():
-                    print(f" Found duplicates in {round_col}:")
-                    duplicates = df_to_merge[df_to_merge["Team"].duplicated(keep=False)]
-                    print(duplicates)
-
-                    # Sum scores for duplicate teams
-                    df_to_merge = df_to_merge.groupby("Team", as_index=False)[round_col].sum()
-                    print(f"after dedup in {round_col}: {len(df_to_merge)} rows")
-
-                master_df = master_df.merge(df_to_merge, on="Team", how="left")
-        else:
-            master_df[f"Round {i}"] = 0
+    if build_state is not None:
+        build_state.mark("parse", f"skipped {reused_rounds}/{len(parsed)} rounds (unchanged content)")
 
-    master_df.fillna(0, inplace=True)
+    if not parsed:
+        logger.warning("No valid data found across all rounds.")
+        return None
 
-    # Convert all round columns to int
-    round_columns = [col for col in master_df.columns if col != "Team"]
-    for col in round_columns:
-        master_df[col] = master_df[col].astype(int)
+    if build_state is not None:
+        # Hand-edited aliases change the result without any source changing
+        previous = build_state.begin_assembly(round_parts + ([registry.fingerprint()] if registry is not None else []))
+        if previous is not None:
+            build_state.mark("normalize", "skipped (no source changed)")
+            build_state.mark("assemble", "skipped (no source changed)")
+            board = Board.from_rows(*previous)
+            if history is not None:
+                with metrics.stage("history"):
+                    history.append(board)
+            return board
+        build_state.mark("normalize", "ran")
+        build_state.mark("assemble", "ran")
 
-    # Final deduplication check (shouldn't be needed but just in case)
-    if master_df["Team"].duplicated().any():
-        print("Final deduplication check found duplicates:")
-        duplicates = master_df[master_df["Team"].duplicated(keep=False)]
-        print(duplicates)
+    # Normalize team names
+    all_names = [name for _, _, teams, _ in parsed for name in teams]
+    logger.info("Normalizing %d team name instances...", len(all_names))
+    with metrics.stage("normalize"):
+        name_map = normalize_team_names(all_names, workers=workers, registry=registry, score_cache=score_cache)
+        if registry is not None:
+            registry.save()
+        if score_cache is not None:
+            score_cache.save()
+
+    # Apply normalization, then build the whole board in one pass
+    with metrics.stage("assemble"):
+        rounds = []
+        for round_num, round_name, teams, scores in parsed:
+            teams = [name_map.get(name, name) for name in teams]
+            rounds.append((round_num, round_name, teams, scores))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("After normalization: %d unique teams in %s", len(set(teams)), round_name)
+
+        # Rounds numbered past the usual 8 get their own slots instead of being dropped
+        round_slots = range(1, max([8] + [r[0] for r in rounds]) + 1)
+        board = assemble_board(rounds, round_slots)
+
+    logger.info("Final leaderboard: %d teams, %d round columns", len(board), len(board.columns))
+    if build_state is not None:
+        build_state.save_assembly(board.header(), board.rows())
+    if history is not None:
+        with metrics.stage("history"):
+            history.append(board)
+    return board
+
+
+def get_leaderboard_dataframe(rounds_config=None, max_workers=8, per_host_limit=4, cache=None, build_state=None,
+                              registry=None, sources=None, history=None, score_cache=None, workers=1):
+    '''
 
-        # Group by team and sum all scores
-        team_col = master_df[["Team"]].copy()
-        score_cols = master_df[round_columns]
+    ROUND NUMBER + URL + COLUMN HEADINGS
 
-        master_df = team_col.groupby("Team", as_index=False).first()
-        summed_scores = score_cols.groupby(master_df["Team"]).sum().reset_index()
-        master_df = master_df.merge(summed_scores, on="Team")
-        print(f"Final deduplication complete: {len(master_df)} unique teams")
+    DataFrame (Team, one column per round, Total) of build_leaderboard's board;
+    takes the same arguments.
 
-    master_df["Total"] = master_df[round_columns].sum(axis=1)
+    '''
+    import pandas as pd
+    from assembly import board_frame
 
-    print(f"Final leaderboard: {len(master_df)} teams, {len(round_columns)} round columns")
-    return master_df
+    board = build_leaderboard(rounds_config, max_workers=max_workers, per_host_limit=per_host_limit, cache=cache,
+                              build_state=build_state, registry=registry, sources=sources, history=history,
+                              score_cache=score_cache, workers=workers)
+    if board is None:
+        return pd.DataFrame(columns=["Team", "Total"])
+    return board_frame(board)
@@ -0,0 +1,181 @@
+from array import array
+from bisect import bisect_left
+
+from board import Board
+
+# Share of teams changed in one apply() above which re-sorting the whole board is cheaper
+REBUILD_SHARE = 0.05
+
+
+class Ranking:
+    """
+    A board kept sorted by (-total, team), so a single score change re-ranks
+    without sorting everything again.
+
+    Positions are competition ranks (equal totals share a position and the
+    next one is skipped), the same as Board.rank(). Finding a team's row or
+    position is a bisect, O(log n); moving a row is one list pop and insert,
+    a memmove rather than a sort. Listing the teams it displaced costs a
+    bisect each, so callers that only need the changed rows skip that.
+    Scores are integers, like everywhere else on the board.
+    """
+
+    def __init__(self, board):
+        self.columns = list(board.columns)
+        self._column_index = {col: k for k, col in enumerate(self.columns)}
+        rows = zip(*board.scores) if board.scores else [()] * len(board.teams)
+        self.scores = {team: list(row) for team, row in zip(board.teams, rows)}
+        self.totals = dict(zip(board.teams, board.totals))
+        self.order = sorted((-total, team) for team, total in self.totals.items())
+
+    def __len__(self):
+        return len(self.order)
+
+    def __contains__(self, team):
+        return team in self.totals
+
+    def position(self, team):
+        """
+        Competition rank of a team: 1 + number of teams with a higher total
+        """
+        return bisect_left(self.order, (-self.totals[team],)) + 1
+
+    def row(self, index):
+        """
+        (position, team, scores, total) of the row at index, in board order
+        """
+        negative_total, team = self.order[index]
+        return bisect_left(self.order, (negative_total,)) + 1, team, self.scores[team], -negative_total
+
+    def update(self, team, column, score):
+        """
+        Set one score. A team not on the board yet is added with zeros elsewhere.
+        Returns (rows, moved):
+          rows   range of row indices whose content changed; when a team was
+                 added it runs to the end of the board, since every row below shifted
+          moved  (team, old position, new position) of every team whose position
+                 changed (old is None for a new team), ordered by new position
+        """
+        k = self._column_index[column]
+        scores = self.scores.get(team)
+        if scores is None:
+            scores = self.scores[team] = [0] * len(self.columns)
+        old_total = self.totals.get(team)
+        scores[k] = score
+        return self._move(team, old_total, sum(scores))
+
+    def remove(self, team):
+        """
+        Take a team off the board; returns (rows, moved) like update(),
+        with None as the new position of the removed team
+        """
+        rows, moved = self._move(team, self.totals[team], None)
+        del self.scores[team]
+        return rows, moved
+
+    def _move(self, team, old_total, total, moved=True):
+        """
+        Re-place one team after its total changed (None = not on the board).
+        With moved=False the list of displaced teams is not built and comes back as None.
+        """
+        old_position = old_index = None
+        if old_total is not None:
+            if moved:
+                old_position = self.position(team)
+            old_index = bisect_left(self.order, (-old_total, team))
+            self.order.pop(old_index)
+            del self.totals[team]
+        new_index = None
+        if total is not None:
+            self.totals[team] = total
+            new_index = bisect_left(self.order, (-total, team))
+            self.order.insert(new_index, (-total, team))
+
+        # Other teams change position only if their total t lies between the two:
+        # t in [old, new) moves down one place, t in [new, old) moves up one.
+        # Joining the board pushes everyone below down, leaving pulls them up.
+        if old_total is None:
+            low, high, shift = None, total, 1
+        elif total is None:
+            low, high, shift = None, old_total, -1
+        else:
+            low, high = min(old_total, total), max(old_total, total)
+            shift = 1 if total > old_total else -1
+        start = bisect_left(self.order, (-(high - 1),))
+        stop = len(self.order) if low is None else bisect_left(self.order, (-(low - 1),))
+
+        if old_index is None or new_index is None:
+            first = new_index if old_index is None else old_index
+            rows = range(min(first, start), len(self.order))
+        else:
+            rows = range(min(old_index, new_index, start), max(old_index + 1, new_index + 1, stop))
+        if not moved:
+            return rows, None
+
+        displaced = []
+        for negative_total, other in self.order[start:stop]:
+            if other != team:
+                new_position = bisect_left(self.order, (negative_total,)) + 1
+                displaced.append((other, new_position - shift, new_position))
+        new_position = self.position(team) if total is not None else None
+        if new_position != old_position:
+            displaced.append((team, old_position, new_position))
+        displaced.sort(key=lambda item: (item[2] is None, item[2] or 0, item[0]))
+        return rows, displaced
+
+    def apply(self, board, max_share=REBUILD_SHARE):
+        """
+        Bring the ranking in line with a freshly assembled board, moving only
+        the teams whose scores differ. Returns the range of rows that changed
+        (running to the end if the board grew or shrank), or None if the
+        ranking has to be rebuilt from the board instead: the round columns
+        differ, or more than max_share of the teams changed, where one sort
+        is cheaper than moving them one at a time (None: never).
+        """
+        if list(board.columns) != self.columns:
+            return None
+        scores, totals = self.scores, self.totals
+        rows_of = zip(*board.scores) if board.scores else [()] * len(board.teams)
+        limit = float("inf") if max_share is None else max(1, len(self.order) * max_share)
+        changed = []
+        for team, total, row in zip(board.teams, board.totals, rows_of):
+            current = scores.get(team)
+            if current is None or totals[team] != total or list(row) != current:
+                changed.append((team, total, row))
+                if len(changed) > limit:
+                    return None
+        seen = set(board.teams)
+        removed = [team for team in totals if team not in seen]
+        if len(changed) + len(removed) > limit:
+            return None
+
+        start, stop = len(self.order), 0
+        for team in removed:
+            rows, _ = self._move(team, totals[team], None, moved=False)
+            del scores[team]
+            start, stop = min(start, rows.start), max(stop, rows.stop)
+        for team, total, row in changed:
+            old_total = totals.get(team)
+            scores[team] = list(row)
+            if old_total == total:
+                # Same place, only the cells differ
+                index = bisect_left(self.order, (-total, team))
+                rows = range(index, index + 1)
+            else:
+                rows, _ = self._move(team, old_total, total, moved=False)
+            start, stop = min(start, rows.start), max(stop, rows.stop)
+        start = min(start, len(self.order))
+        return range(start, min(max(stop, start), len(self.order)))
+
+    def to_board(self):
+        """
+        Ranked Board (sorted, with positions) of the current state
+        """
+        teams = [team for _, team in self.order]
+        columns = list(zip(*[self.scores[team] for team in teams])) if teams else [()] * len(self.columns)
+        board = Board(teams, self.columns, columns, [-negative_total for negative_total, _ in self.order])
+        positions = array("q")
+        for k, (negative_total, _) in enumerate(self.order):
+            positions.append(positions[-1] if k and negative_total == self.order[k - 1][0] else k + 1)
+        board.positions = positions
+        return board
@@ -0,0 +1,302 @@
+import os
+import re
+from datetime import datetime, timezone
+
+from ranking import REBUILD_SHARE, Ranking
+
+# Rows handed to the file per write() call
+CHUNK_ROWS = 500
+
+EMPTY_CELL = '<td class="empty-cell">-</td>'
+
+MOVED_UP = ' <span class="text-green-400 text-xs">&#9650;{}</span>'
+MOVED_DOWN = ' <span class="text-red-400 text-xs">&#9660;{}</span>'
+NEW_ENTRY = ' <span class="text-sky-400 text-xs">new</span>'
+
+ROW_START = """
+        <tr class="hover:bg-slate-700 transition-all duration-150">
+          <td><div class="rank """
+ROW_AFTER_RANK_CLASS = """">"""
+ROW_AFTER_RANK = """</div></td>
+          <td>"""
+ROW_AFTER_TEAM = """</td>
+          """
+ROW_AFTER_SCORES = """
+          <td><span class="total-score">"""
+ROW_END = """</span></td>
+        </tr>
+        """
+
+PAGE_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1.0"/>
+  <title>ERC-2025 Leaderboard</title>$data_link
+  <script src="https://cdn.tailwindcss.com"></script>
+  <style>
+        body {
+          font-family: 'Inter', sans-serif;
+          color: #e2e8f0;
+          background: url('$background') no-repeat center center fixed;
+          background-size: cover;
+        }$background_variants
+
+    .rank {
+      font-weight: bold;
+      font-size: 1rem;
+      background-color: #334155;
+      border-radius: 9999px;
+      width: 35px;
+      height: 35px;
+      display: flex;
+      align-items: center;
+      justify-content: center;
+      margin: auto;
+    }
+
+    .rank-1 {
+      background: linear-gradient(135deg, #fde047, #f59e0b);
+      box-shadow: 0 0 10px rgba(245, 158, 11, 0.5);
+    }
+
+    .rank-2 {
+      background: linear-gradient(135deg, #e5e7eb, #9ca3af);
+      box-shadow: 0 0 10px rgba(156, 163, 175, 0.5);
+    }
+
+    .rank-3 {
+      background: linear-gradient(135deg, #f97316, #b45309);
+      box-shadow: 0 0 10px rgba(180, 83, 9, 0.5);
+    }
+    
+  </style>
+</head>
+<body>
+  <div class="overlay">
+    <div class="max-w-7xl mx-auto">
+        <div class="flex flex-col items-center mb-6">
+          <img src="assets/logo.png" alt="ERC Logo" class="w-80 h-auto mb-4" />
+          <h1 class="text-5xl font-bold glow text-center text-gray-800">Live Leaderboard</h1>
+        </div>
+
+      <div class="overflow-x-auto rounded-lg shadow-md">
+        <table class="min-w-full divide-y divide-slate-700 bg-slate-800 text-sm text-center">
+          <thead class="bg-slate-900 text-slate-300 uppercase tracking-wider text-xs">
+            <tr>
+              <th class="px-4 py-3">Position</th>
+              <th class="px-4 py-3">Team</th>
+              $round_headers
+              <th class="px-4 py-3">Total</th>
+            </tr>
+          </thead>
+          <tbody class="divide-y divide-slate-700">
+            $rows
+          </tbody>
+        </table>$pager
+      </div>
+    </div>
+  </div>
+
+
+<!-- Animated Footer -->
+<footer style="font-family: inherit; font-size: 1.1em; text-align: center; margin-top: 1em;">
+        <div class="text-center text-white-400 text-l mt-6">
+          Last updated: $updated
+        </div>
+  Made with 
+  <span class="inline-block animate-bounce mx-1">❤️</span>
+  by IITB Mars Rover Team
+</footer>
+
+</body>
+</html>
+"""
+
+
+def _compile(template):
+    """
+    Split the page template once into static chunks and placeholder names
+    """
+    parts = re.split(r"\$(\w+)", template)
+    return parts[0::2], parts[1::2]
+
+
+_PAGE_CHUNKS, _PAGE_FIELDS = _compile(PAGE_TEMPLATE)
+
+
+def _score_cells(values):
+    """
+    '<td>N</td>' for every non-zero score of one column, the empty cell otherwise
+    """
+    return [EMPTY_CELL if v == 0 else "<td>" + str(v) + "</td>" for v in values]
+
+
+def _movement(change):
+    if change is None:
+        return NEW_ENTRY
+    if change > 0:
+        return MOVED_UP.format(change)
+    if change < 0:
+        return MOVED_DOWN.format(-change)
+    return ""
+
+
+def render_rows(board, changes=None):
+    """
+    HTML of every table row of a ranked Board, built column by column instead of row by row
+    changes: places gained per row since the previous board (None = new team), shown as arrows
+    """
+    positions = board.positions.tolist()
+    teams = [str(team) for team in board.teams]
+    if changes is not None:
+        teams = [team + _movement(change) for team, change in zip(teams, changes)]
+    rank_classes = [f"rank-{rank}" if rank <= 3 else "rank" for rank in positions]
+    if board.scores:
+        score_html = ["".join(cells) for cells in zip(*[_score_cells(col) for col in board.scores])]
+    else:
+        score_html = [""] * len(board)
+
+    return [
+        ROW_START + rank_class + ROW_AFTER_RANK_CLASS + str(rank) + ROW_AFTER_RANK + team
+        + ROW_AFTER_TEAM + scores + ROW_AFTER_SCORES + str(total) + ROW_END
+        for rank_class, rank, team, scores, total
+        in zip(rank_classes, positions, teams, score_html, board.totals)
+    ]
+
+
+def render_row(position, team, scores, total):
+    """
+    HTML of a single row, identical to the one render_rows builds
+    """
+    rank_class = f"rank-{position}" if position <= 3 else "rank"
+    return (ROW_START + rank_class + ROW_AFTER_RANK_CLASS + str(position) + ROW_AFTER_RANK + str(team)
+            + ROW_AFTER_TEAM + "".join(_score_cells(scores)) + ROW_AFTER_SCORES + str(total) + ROW_END)
+
+
+class LivePage:
+    """
+    Ranking and row HTML kept from one build to the next (watch mode), so a
+    rebuild re-renders only the rows whose content changed. When many teams
+    changed (a round published or corrected), it ranks and renders the board
+    afresh instead, which is cheaper than moving them one by one.
+    """
+
+    def __init__(self):
+        self.ranking = None
+        self.rows = None
+
+    def update(self, board):
+        """
+        Rank a freshly assembled Board; returns (ranked Board, HTML of every row)
+        """
+        touched = self.ranking.apply(board) if self.ranking is not None else None
+        if touched is None:
+            self.ranking = Ranking(board)
+            ranked = self.ranking.to_board()
+            self.rows = render_rows(ranked)
+            return ranked, self.rows
+        ranked = self.ranking.to_board()
+        if len(touched) > len(ranked) * REBUILD_SHARE:
+            # A long stretch of shifted rows renders faster column-wise
+            self.rows = render_rows(ranked)
+            return ranked, self.rows
+        fresh = [render_row(*self.ranking.row(i)) for i in touched]
+        if len(self.rows) != len(self.ranking):
+            # Rows from the first change on shifted; touched runs to the end here
+            self.rows[touched.start:] = fresh
+        else:
+            self.rows[touched.start:touched.stop] = fresh
+        return ranked, self.rows
+
+
+def _background_css(variants):
+    """
+    Rules that swap in the smallest background copy covering the viewport,
+    as WebP where the browser understands image-set() with type().
+    variants: (width, jpg path, webp path), widest first, see optimize_background
+    """
+    rules = []
+    for k, (width, jpg, webp) in enumerate(variants):
+        image_set = f"image-set(url('{webp}') type('image/webp'), url('{jpg}') type('image/jpeg'))"
+        # A browser without image-set() drops that declaration and keeps the JPEG
+        rule = f"body {{ background-image: url('{jpg}'); background-image: {image_set}; }}"
+        rules.append(rule if k == 0 else f"@media (max-width: {width}px) {{ {rule} }}")
+    return "".join("\n        " + rule for rule in rules)
+
+
+def _page_path(output_path, page):
+    if page == 1:
+        return output_path
+    root, ext = os.path.splitext(output_path)
+    return f"{root}-{page}{ext}"
+
+
+def _pager(output_path, page, pages):
+    links = []
+    for number in range(1, pages + 1):
+        href = os.path.basename(_page_path(output_path, number))
+        current = ' class="font-bold underline"' if number == page else ""
+        links.append(f'<a href="{href}"{current}>{number}</a>')
+    return '\n        <nav class="flex justify-center gap-3 py-3">' + " ".join(links) + "</nav>"
+
+
+def _write_page(path, fields, rows):
+    # Write next to the target and rename, so a served page is never half-written
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for chunk, field in zip(_PAGE_CHUNKS, _PAGE_FIELDS):
+            f.write(chunk)
+            if field == "rows":
+                for start in range(0, len(rows), CHUNK_ROWS):
+                    f.write("".join(rows[start:start + CHUNK_ROWS]))
+            else:
+                f.write(fields[field])
+        f.write(_PAGE_CHUNKS[-1])
+    os.replace(tmp_path, path)
+
+
+def render_leaderboard(board, output_path="index.html", page_size=None, generated_at=None,
+                       background="assets/mars.jpg", changes=None, rows=None, data=None):
+    """
+    Write a ranked Board as HTML.
+
+    The single-page output is byte-for-byte what the old f-string renderer produced.
+    page_size: split very large boards into pages of this many rows
+               (index.html, index-2.html, ...), each with links to the others
+    background: site-relative path of the page background image, or the
+                resized copies optimize_background made
+    changes: rank movement per row for up/down arrows, see render_rows
+    rows: already rendered row HTML (LivePage), instead of rendering every row
+    data: page-relative path of the exported JSON, linked from every page
+    Returns the list of files written.
+    """
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc)
+    round_headers = ''.join([f'<th class="px-4 py-3">{col}</th>' for col in board.columns])
+    updated = generated_at.strftime('%Y-%m-%d %H:%M:%S UTC')
+    if rows is None:
+        rows = render_rows(board, changes)
+    background_variants = ""
+    if not isinstance(background, str):
+        background_variants = _background_css(background)
+        background = background[0][1]
+    data_link = "" if data is None else f'\n  <link rel="alternate" type="application/json" href="{data}">'
+
+    pages = 1 if not page_size else max(1, -(-len(rows) // page_size))
+    written = []
+    for page in range(1, pages + 1):
+        page_rows = rows if pages == 1 else rows[(page - 1) * page_size:page * page_size]
+        fields = {
+            "round_headers": round_headers,
+            "updated": updated,
+            "pager": "" if pages == 1 else _pager(output_path, page, pages),
+            "background": background,
+            "background_variants": background_variants,
+            "data_link": data_link,
+        }
+        path = _page_path(output_path, page)
+        _write_page(path, fields, page_rows)
+        written.append(path)
+    return written
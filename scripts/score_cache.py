@@ -0,0 +1,137 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+from collections import OrderedDict
+
+from fetch_cache import CACHE_ROOT
+
+DEFAULT_SCORE_CACHE = os.path.join(CACHE_ROOT, "pair_scores.json")
+DEFAULT_MAX_ENTRIES = 200000
+
+# Bump when the scorer or the name normalization changes so old scores are ignored
+SCORE_CACHE_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreCache:
+    """
+    Persistent similarity scores of name pairs, so names seen in earlier builds
+    are not scored again.
+
+    Names are the token-sorted, lowercased texts the matcher compares. Scores
+    are kept per query name, one row of {other name: score} each, stored
+    without a cutoff so one entry serves every threshold. The score is
+    symmetric, so a pair is found from either name's row.
+    max_entries: pairs kept; the least recently used rows are dropped beyond this
+    """
+
+    def __init__(self, path=DEFAULT_SCORE_CACHE, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._rows = OrderedDict()
+        self._size = 0
+        self._dirty = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == SCORE_CACHE_VERSION:
+                # Most recent rows last; a smaller max_entries than the cache was written with keeps those
+                rows = []
+                for query, row in reversed(data["rows"]):
+                    if self._size + len(row) > max_entries:
+                        break
+                    rows.append((query, row))
+                    self._size += len(row)
+                self._rows = OrderedDict(reversed(rows))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        logger.debug("Loaded %d cached pair scores from %s", self._size, path)
+
+    def __len__(self):
+        return self._size
+
+    def lookup(self, query, choices):
+        """
+        Cached score of query against each choice, None where it is missing
+        """
+        rows = self._rows
+        row = rows.get(query)
+        if row is None:
+            scores = [None] * len(choices)
+        else:
+            rows.move_to_end(query)
+            get = row.get
+            scores = [get(choice) for choice in choices]
+        for k, score in enumerate(scores):
+            if score is None:
+                # Scored before with the names the other way round
+                other = rows.get(choices[k])
+                if other is not None and query in other:
+                    scores[k] = other[query]
+                    rows.move_to_end(choices[k])
+        if choices:
+            self._dirty = True
+        return scores
+
+    def update(self, query, choices, scores):
+        row = self._rows.get(query)
+        if row is None:
+            row = self._rows[query] = {}
+        else:
+            self._rows.move_to_end(query)
+        size = len(row)
+        row.update(zip(choices, scores))
+        self._size += len(row) - size
+        while self._size > self.max_entries and self._rows:
+            self._size -= len(self._rows.popitem(last=False)[1])
+        self._dirty = True
+
+    def save(self):
+        """
+        Write the cache (least recently used first) if anything changed
+        """
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": SCORE_CACHE_VERSION, "rows": list(self._rows.items())}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def _read_names(args):
+    if args.aliases:
+        from alias_registry import AliasRegistry
+        registry = AliasRegistry(args.aliases)
+        names = list(registry.pins) + list(registry.aliases)
+    else:
+        with open(args.names, encoding="utf-8") if args.names != "-" else sys.stdin as f:
+            names = [line.strip() for line in f]
+    return list(dict.fromkeys(name for name in names if name))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the pairwise name similarity matrix the team matcher uses, as CSV")
+    parser.add_argument("names", nargs="?", default="-", help="file with one team name per line (default: stdin)")
+    parser.add_argument("--aliases", default=None, help="take every raw name of this alias registry instead")
+    parser.add_argument("--score-cache", default=DEFAULT_SCORE_CACHE, help="pair score cache to read and extend")
+    parser.add_argument("--workers", type=int, default=1, help="cores used to score missing pairs (-1 = all)")
+    args = parser.parse_args()
+
+    from name_matching import score_matrix
+
+    cache = ScoreCache(args.score_cache)
+    names = _read_names(args)
+    matrix = score_matrix(names, workers=args.workers, score_cache=cache)
+    cache.save()
+    writer = csv.writer(sys.stdout)
+    writer.writerow([""] + names)
+    for name, row in zip(names, matrix):
+        writer.writerow([name] + [f"{score:.1f}" for score in row])
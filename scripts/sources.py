@@ -0,0 +1,159 @@
+import argparse
+import fnmatch
+import mmap
+import os
+import subprocess
+from urllib.parse import unquote, urlsplit
+
+RESULTS_PATTERN = "phase_*/*.md"
+
+
+def is_local(url):
+    return url.startswith("file://") or url.startswith("git:")
+
+
+def file_url_path(url):
+    """
+    Filesystem path of a file:// URL (file:///abs/path or file://relative/path)
+    """
+    parts = urlsplit(url)
+    return unquote(parts.netloc + parts.path)
+
+
+def parse_git_url(url):
+    """
+    git:<repo path>@<ref>:<file path>, e.g. git:../erc2025@main:phase_1/qualification_results.md
+    Returns (repo, ref, path).
+    """
+    spec = url[len("git:"):]
+    repo, sep, rest = spec.rpartition("@")
+    ref, colon, path = rest.partition(":")
+    if not sep or not colon or not repo or not ref or not path:
+        raise ValueError(f"Expected git:<repo>@<ref>:<path>, got {url!r}")
+    return repo, ref, path
+
+
+def read_file(path):
+    """
+    Text of a local file, read through a memory map (no intermediate buffers)
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8", errors="replace")
+
+
+def read_git_files(repo, ref, paths):
+    """
+    {path: text or an exception} for files at ref, all read by a single
+    `git cat-file --batch` process
+    """
+    request = "".join(f"{ref}:{path}\n" for path in paths).encode("utf-8")
+    result = subprocess.run(["git", "-C", repo, "cat-file", "--batch"], input=request,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    out = result.stdout
+    files = {}
+    pos = 0
+    for path in paths:
+        end = out.index(b"\n", pos)
+        header = out[pos:end].decode("utf-8", errors="replace")
+        pos = end + 1
+        if header.endswith(" missing") or header.endswith(" ambiguous"):
+            files[path] = FileNotFoundError(f"{path} not found at {ref} in {repo}")
+            continue
+        _, kind, size = header.rsplit(" ", 2)
+        body = out[pos:pos + int(size)]
+        pos += int(size) + 1  # body is followed by a newline
+        if kind != "blob":
+            files[path] = IsADirectoryError(f"{path} at {ref} in {repo} is a {kind}")
+        else:
+            files[path] = body.decode("utf-8", errors="replace")
+    return files
+
+
+def read_local_sources(urls):
+    """
+    (md_text, error) for each file:// or git: URL, in order.
+    Git URLs are grouped so each (repo, ref) costs one git process.
+    """
+    results = {}
+    git_groups = {}
+    for url in urls:
+        if url.startswith("git:"):
+            try:
+                repo, ref, path = parse_git_url(url)
+            except ValueError as e:
+                results[url] = (None, e)
+                continue
+            git_groups.setdefault((repo, ref), []).append((url, path))
+        else:
+            try:
+                results[url] = (read_file(file_url_path(url)), None)
+            except OSError as e:
+                results[url] = (None, e)
+
+    for (repo, ref), entries in git_groups.items():
+        try:
+            files = read_git_files(repo, ref, sorted({path for _, path in entries}))
+        except (OSError, subprocess.CalledProcessError) as e:
+            for url, _ in entries:
+                results[url] = (None, e)
+            continue
+        for url, path in entries:
+            body = files[path]
+            results[url] = (None, body) if isinstance(body, Exception) else (body, None)
+    return [results[url] for url in urls]
+
+
+def discover_results(root, ref=None, pattern=RESULTS_PATTERN):
+    """
+    Every results file (phase_*/*.md by default) of a results repo checkout,
+    or of a git ref of it, found in one directory scan / one `git ls-tree`.
+    Returns sorted paths relative to root.
+    """
+    if ref is not None:
+        result = subprocess.run(["git", "-C", root, "ls-tree", "-r", "--name-only", ref],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        names = result.stdout.decode("utf-8", errors="replace").splitlines()
+    else:
+        names = []
+        with os.scandir(root) as phases:
+            for phase in phases:
+                if phase.is_dir():
+                    with os.scandir(phase.path) as files:
+                        names.extend(f"{phase.name}/{f.name}" for f in files if f.is_file())
+    return sorted(name for name in names if fnmatch.fnmatchcase(name, pattern))
+
+
+def load_results(root, ref=None, pattern=RESULTS_PATTERN):
+    """
+    {relative path: text} of every discovered results file
+    """
+    paths = discover_results(root, ref, pattern)
+    if ref is not None:
+        return read_git_files(root, ref, paths)
+    return {path: read_file(os.path.join(root, path)) for path in paths}
+
+
+def local_base(directory=None, git=None):
+    """
+    Base URL that replaces the upstream raw.githubusercontent.com base:
+    file://<directory>/ or git:<repo>@<ref>:
+    """
+    if git is not None:
+        repo, _, ref = git.rpartition("@")
+        if not repo:
+            repo, ref = git, "HEAD"
+        return f"git:{os.path.abspath(repo)}@{ref}:"
+    return "file://" + os.path.abspath(directory).replace(os.sep, "/") + "/"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List the results files of a local results repo")
+    parser.add_argument("root", help="checkout of the results repo (e.g. a clone of husarion/erc2025)")
+    parser.add_argument("--ref", default=None, help="read this git ref instead of the working tree")
+    args = parser.parse_args()
+    for path, text in load_results(args.root, args.ref).items():
+        size = "missing" if isinstance(text, Exception) else f"{len(text)} chars"
+        print(f"{path}  ({size})")
@@ -0,0 +1,85 @@
+import os
+import random
+
+PREFIXES = ["AGH", "IITB", "Sapienza", "CRISS", "Orion", "Kalman", "Vyom", "Impuls", "Raptor", "Ares",
+            "Kosmos", "Shunya", "Rival", "Legendary", "Dagon", "Bangla", "Husky", "Phoenix", "Titan", "Nova"]
+SUFFIXES = ["Space Systems", "Robotics", "Mars Rover", "Rover", "Explorers", "Technology", "Xplorer",
+            "Robotics Club", "Aerospace", "Lab", "Dynamics", "Mechatronics", "Team", "Engineering"]
+
+
+def team_names(count, seed=0):
+    """
+    `count` distinct ERC-looking team names
+    """
+    rng = random.Random(seed)
+    names = []
+    seen = set()
+    while len(names) < count:
+        name = f"{rng.choice(PREFIXES)} {rng.choice(SUFFIXES)}"
+        if len(seen) >= len(PREFIXES) * len(SUFFIXES) // 2:
+            name = f"{name} {len(names)}"
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            names.append(name)
+    return names
+
+
+def _typo(rng, name):
+    i = rng.randrange(1, len(name))
+    return name[:i] + name[i + 1:] if rng.random() < 0.5 else name[:i] + name[i] + name[i:]
+
+
+def name_variant(rng, name, noise):
+    """
+    The way results files actually spell a team: mostly as registered,
+    sometimes "Team X", "X team", a different case or a typo
+    """
+    if rng.random() >= noise:
+        return name
+    kind = rng.randrange(5)
+    if kind == 0 and not name.lower().startswith("team "):
+        return "Team " + name
+    if kind == 1 and not name.lower().endswith(" team"):
+        return name + " team"
+    if kind == 2:
+        return name.upper()
+    if kind == 3:
+        return _typo(rng, name)
+    return name.lower()
+
+
+def results_markdown(teams, round_num, noise=0.2, duplicates=0.02, seed=0):
+    """
+    One ERC-style results file: prose, the scored table, then an unrelated table
+    """
+    rng = random.Random(seed * 1000 + round_num)
+    lines = [f"# Round {round_num} results", "", "Points are final unless stated otherwise.", "",
+             "| No. | Team name | University | Score | Comment |",
+             "|:---:|---|---|:---:|---|"]
+    row = 0
+    for team in teams:
+        if rng.random() < 0.1:
+            continue  # team did not take part
+        copies = 2 if rng.random() < duplicates else 1
+        for _ in range(copies):
+            row += 1
+            lines.append(f"| {row} | {name_variant(rng, team, noise)} | University {rng.randint(1, 300)} "
+                         f"| {rng.randint(0, 100)} | |")
+    lines += ["", "Jury remarks:", "", "| Judge | Remark |", "|---|---|", "| A | Well done |", ""]
+    return "\n".join(lines)
+
+
+def write_results_repo(directory, teams=60, rounds=8, noise=0.2, duplicates=0.02, seed=0):
+    """
+    Lay out phase_<n>/round_<n>_results.md files like the upstream repo.
+    Returns a rounds_config with paths relative to the repo root in place of URLs.
+    """
+    names = team_names(teams, seed)
+    config = []
+    for round_num in range(1, rounds + 1):
+        path = f"phase_{round_num}/round_{round_num}_results.md"
+        os.makedirs(os.path.join(directory, f"phase_{round_num}"), exist_ok=True)
+        with open(os.path.join(directory, path), "w", encoding="utf-8") as f:
+            f.write(results_markdown(names, round_num, noise, duplicates, seed))
+        config.append((round_num, f"Round {round_num} Score", path, "Team name", "Score"))
+    return config
@@ -0,0 +1,22 @@
+import json
+
+from alias_registry import AliasRegistry
+from newscraper import normalize_team_names
+
+
+def test_pin_carries_over_to_learned_aliases(tmp_path):
+    path = str(tmp_path / "aliases.json")
+    registry = AliasRegistry(path)
+    normalize_team_names(["Team Rival", "Team Rival", "Rival team"], registry=registry)
+    registry.save()
+    assert registry.aliases["Rival team"] == "Team Rival"
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["pins"] = {"Team Rival": "RIVAL"}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    mapping = normalize_team_names(["Team Rival", "Rival team", "Team Rival Robotics"],
+                                   registry=AliasRegistry(path))
+    assert mapping == {"Team Rival": "RIVAL", "Rival team": "RIVAL", "Team Rival Robotics": "RIVAL"}
@@ -0,0 +1,140 @@
+import http.server
+import os
+import threading
+
+import pytest
+import requests
+
+from fetch_cache import FetchCache
+from local_server import start_server
+from metrics import metrics
+from newscraper import fetch_round_sources
+
+BODY = "| Team name | Score |\n|---|---|\n| A | 3 |\n"
+
+
+class FailingHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_error(503, "Service Unavailable")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    results = tmp_path / "results"
+    results.mkdir()
+    (results / "round.md").write_text(BODY, encoding="utf-8")
+    server, base_url = start_server(str(results))
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    metrics.reset()
+    return str(tmp_path / "cache")
+
+
+def fetch(url, cache):
+    return fetch_round_sources([(1, "Round", url, "Team name", "Score")], cache=cache)[0]
+
+
+def test_not_modified_reuses_the_cached_body(server, cache_dir):
+    url = server + "round.md"
+    assert fetch(url, FetchCache(cache_dir)) == (BODY, None)
+    fetched_at = FetchCache(cache_dir).lookup(url)["fetched_at"]
+
+    metrics.reset()
+    assert fetch(url, FetchCache(cache_dir)) == (BODY, None)
+    counters = metrics.snapshot()["counters"]
+    assert counters["http_requests"] == 1
+    assert counters["cache_hits"] == 1
+    assert "cache_misses" not in counters
+    assert FetchCache(cache_dir).lookup(url)["fetched_at"] > fetched_at
+
+
+def test_missing_source_fails_the_round(server, cache_dir):
+    url = server + "gone.md"
+    cache = FetchCache(cache_dir)
+    # Even with an old copy around: a 404 is an answer, not an outage
+    cache.store(url, BODY, etag='"old"')
+    body, error = fetch(url, cache)
+    assert body is None
+    assert isinstance(error, requests.HTTPError)
+    assert error.response.status_code == 404
+
+
+def test_server_error_falls_back_to_the_cached_copy(cache_dir):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FailingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/round.md"
+        assert isinstance(fetch(url, FetchCache(cache_dir))[1], requests.HTTPError)
+        cache = FetchCache(cache_dir)
+        cache.store(url, BODY, etag='"old"')
+        assert fetch(url, cache) == (BODY, None)
+        assert metrics.snapshot()["counters"]["cache_stale_fallbacks"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_connection_error_falls_back_to_the_cached_copy(tmp_path, cache_dir):
+    results = tmp_path / "results"
+    results.mkdir()
+    (results / "round.md").write_text(BODY, encoding="utf-8")
+    server, base_url = start_server(str(results))
+    url = base_url + "round.md"
+    assert fetch(url, FetchCache(cache_dir)) == (BODY, None)
+    server.shutdown()
+    server.server_close()
+
+    assert fetch(url, FetchCache(cache_dir)) == (BODY, None)
+    assert metrics.snapshot()["counters"]["cache_stale_fallbacks"] == 1
+    assert isinstance(fetch(url, None)[1], requests.ConnectionError)
+
+
+def test_fresh_entry_is_used_without_asking(server, cache_dir):
+    url = server + "round.md"
+    assert fetch(url, FetchCache(cache_dir, max_age=3600)) == (BODY, None)
+    metrics.reset()
+    assert fetch(url, FetchCache(cache_dir, max_age=3600)) == (BODY, None)
+    assert "http_requests" not in metrics.snapshot()["counters"]
+    # max_age=None always revalidates
+    assert fetch(url, FetchCache(cache_dir)) == (BODY, None)
+    assert metrics.snapshot()["counters"]["http_requests"] == 1
+
+
+def test_offline_serves_only_the_cache(server, cache_dir):
+    url = server + "round.md"
+    body, error = fetch(url, FetchCache(cache_dir, offline=True))
+    assert body is None
+    assert isinstance(error, LookupError)
+    assert FetchCache(cache_dir).lookup(url) is None
+
+    assert fetch(url, FetchCache(cache_dir)) == (BODY, None)
+    metrics.reset()
+    assert fetch(url, FetchCache(cache_dir, offline=True)) == (BODY, None)
+    assert "http_requests" not in metrics.snapshot()["counters"]
+
+
+def test_evict_drops_least_recently_used_entries(cache_dir, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr("fetch_cache.time.time", lambda: next(clock))
+    cache = FetchCache(cache_dir, max_bytes=250)
+    for name in ("a", "b", "c"):
+        cache.store(name, name * 100)
+    cache.touch("a")
+
+    assert cache.evict() == ["b"]
+    assert cache.lookup("b") is None
+    assert cache.lookup("a")["body"] == "a" * 100
+    assert cache.evict() == []
+
+    cache.max_bytes = 0
+    cache.save()
+    assert FetchCache(cache_dir).lookup("c") is None
+    assert os.listdir(cache_dir) == ["index.json"]
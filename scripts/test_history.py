@@ -0,0 +1,85 @@
+import os
+
+from board import Board
+from history import ScoreHistory
+
+
+def board_of(scores, columns=("R1", "R2")):
+    teams = sorted(scores)
+    return Board(teams, columns, [[scores[team][j] for team in teams] for j in range(len(columns))])
+
+
+def ranks(scores):
+    totals = {team: sum(row) for team, row in scores.items()}
+    return {team: 1 + sum(other > total for other in totals.values()) for team, total in totals.items()}
+
+
+def test_same_board_is_stored_once(tmp_path):
+    # Enough boards that some raw sha256 prefixes end in a NUL byte
+    for seed in range(300):
+        history = ScoreHistory(str(tmp_path / str(seed)))
+        board = board_of({"A": [seed, 1], "B": [2, seed % 7]})
+        for _ in range(3):
+            assert history.append(board, timestamp=1.0) == 0
+        assert len(history) == 1
+        assert history.append(board_of({"A": [seed, 2], "B": [2, seed % 7]}), timestamp=2.0) == 1
+
+
+def test_positions_and_rank_change(tmp_path):
+    history = ScoreHistory(str(tmp_path))
+    first = {"A": [5, 0], "B": [3, 0], "C": [3, 0]}
+    second = {"A": [5, 0], "B": [3, 4], "C": [3, 0], "D": [9, 9]}
+    history.append(board_of(first), timestamp=10.0)
+    history.append(board_of(second), timestamp=20.0)
+
+    assert history.positions(0) == ranks(first)
+    assert history.positions() == ranks(second)
+    assert history.rank_change(-2) == {
+        team: (ranks(first)[team] - position if team in first else None)
+        for team, position in ranks(second).items()}
+
+    # A fresh instance reads the same store
+    reopened = ScoreHistory(str(tmp_path))
+    assert reopened.positions(-2) == ranks(first)
+    teams, columns, scores = reopened.load(-1)
+    assert columns == ["R1", "R2"]
+    assert {team: list(row) for team, row in zip(teams, scores.tolist())} == second
+
+
+def test_trajectory_and_snapshot_at(tmp_path):
+    history = ScoreHistory(str(tmp_path))
+    history.append(board_of({"A": [1, 0], "B": [2, 0]}), timestamp=10.0)
+    history.append(board_of({"B": [2, 0]}), timestamp=20.0)
+    history.append(board_of({"A": [5, 0], "B": [2, 0]}), timestamp=30.0)
+
+    assert history.trajectory("A") == [(10.0, 1, 2), (30.0, 5, 1)]
+    assert history.trajectory("B") == [(10.0, 2, 1), (20.0, 2, 1), (30.0, 2, 2)]
+    assert history.trajectory("Z") == []
+    assert history.snapshot_at(5.0) is None
+    assert history.snapshot_at(10.0) == 0
+    assert history.snapshot_at(25.0) == 1
+    assert history.snapshot_at(99.0) == 2
+
+
+def test_append_recovers_from_an_interrupted_one(tmp_path):
+    history = ScoreHistory(str(tmp_path))
+    first = {"A": [1, 2], "B": [3, 4]}
+    history.append(board_of(first), timestamp=1.0)
+
+    # A crash after the data files were written but before the record:
+    # rows nothing points to, and half a snapshot record
+    for name in ("team_ids.bin", "totals.bin", "scores.bin"):
+        with open(os.path.join(str(tmp_path), name), "ab") as f:
+            f.write(b"\xff" * 40)
+    with open(os.path.join(str(tmp_path), "snapshots.bin"), "ab") as f:
+        f.write(b"\xff" * (ScoreHistory.RECORD.itemsize // 2))
+
+    history = ScoreHistory(str(tmp_path))
+    assert len(history) == 1
+    second = {"A": [9, 9], "C": [1, 0]}
+    assert history.append(board_of(second), timestamp=2.0) == 1
+    assert len(history) == 2
+    assert history.positions(0) == ranks(first)
+    assert history.positions(1) == ranks(second)
+    teams, _, scores = history.load(1)
+    assert {team: list(row) for team, row in zip(teams, scores.tolist())} == second
@@ -0,0 +1,136 @@
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+from rapidfuzz import fuzz
+
+from name_matching import match_team_names
+from score_cache import ScoreCache
+from synthetic import name_variant, team_names
+
+WORDS = ["team", "robotics", "rover", "mars", "club", "group", "space", "agh", "kn", "impuls",
+         "legendary", "rover", "systems", "polytechnic", "warsaw", "mit", "iitb", "ares", "ukr", "bit"]
+
+
+def reference_match(sorted_teams, threshold):
+    """
+    The original pairwise loop of normalize_team_names, kept as the definition
+    of which names merge
+    """
+    canonical = []
+    mapping = {}
+    for team in sorted_teams:
+        if not canonical:
+            canonical.append(team)
+            mapping[team] = team
+            continue
+        best_match = None
+        best_score = 0
+        should_merge = False
+        for canonical_name in canonical:
+            team_lower = team.lower().strip()
+            canonical_lower = canonical_name.lower().strip()
+            score = fuzz.token_sort_ratio(team_lower, canonical_lower)
+            team_words = set(team_lower.split())
+            canonical_words = set(canonical_lower.split())
+            if score >= 95:
+                should_merge, best_match, best_score = True, canonical_name, score
+                break
+            elif team_words.issubset(canonical_words) or canonical_words.issubset(team_words):
+                if len(team_words & canonical_words) >= min(len(team_words), len(canonical_words)):
+                    should_merge, best_match, best_score = True, canonical_name, score
+                    break
+            elif score >= threshold:
+                common_words = team_words & canonical_words
+                min_words = min(len(team_words), len(canonical_words))
+                if len(common_words) >= 2 and len(common_words) >= min_words * 0.7:
+                    generic_words = {'team', 'robotics', 'robot', 'rover', 'mars', 'club', 'group'}
+                    if not (team_words.issubset(generic_words) or canonical_words.issubset(generic_words)):
+                        if score > best_score:
+                            should_merge, best_match, best_score = True, canonical_name, score
+        if should_merge and best_match:
+            if len(team) > len(best_match):
+                canonical[canonical.index(best_match)] = team
+                for k, v in mapping.items():
+                    if v == best_match:
+                        mapping[k] = team
+                mapping[team] = team
+            else:
+                mapping[team] = best_match
+        else:
+            canonical.append(team)
+            mapping[team] = team
+    return mapping
+
+
+def _typo(rng, name):
+    i = rng.randrange(len(name))
+    kind = rng.randrange(3)
+    if kind == 0:
+        return name[:i] + name[i + 1:]
+    if kind == 1:
+        return name[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz ") + name[i:]
+    return name[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + name[i + 1:]
+
+
+def word_names(rng, count):
+    """
+    Short names from a small vocabulary, so subsets, shared words, generic
+    names and near-typos all come up often
+    """
+    names = []
+    for _ in range(count):
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            name = _typo(rng, name)
+        if rng.random() < 0.2:
+            name = name.title()
+        names.append(name.strip() or "team")
+    return names
+
+
+def synthetic_names(rng, count, seed):
+    return [name_variant(rng, name, 0.5) for name in team_names(count, seed) for _ in range(rng.randint(1, 3))]
+
+
+def priority_order(names):
+    # What normalize_team_names hands to the matcher
+    counts = {}
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+    return sorted(counts, key=lambda x: (-counts[x], -len(x)))
+
+
+@pytest.mark.parametrize("threshold", [60, 70, 85, 92])
+@pytest.mark.parametrize("seed", range(12))
+def test_matches_the_original_loop(seed, threshold):
+    rng = random.Random(seed * 100 + threshold)
+    names = word_names(rng, 120) if seed % 2 else synthetic_names(rng, 80, seed)
+    teams = priority_order(names)
+    mapping, _ = match_team_names(teams, threshold=threshold)
+    assert mapping == reference_match(teams, threshold)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_score_cache_does_not_change_merges(seed, tmp_path):
+    rng = random.Random(seed)
+    teams = priority_order(word_names(rng, 150) + synthetic_names(rng, 60, seed))
+    expected = reference_match(teams, 85)
+    path = str(tmp_path / "pair_scores.json")
+    for _ in range(2):
+        cache = ScoreCache(path)
+        mapping, _ = match_team_names(teams, threshold=85, score_cache=cache)
+        cache.save()
+        assert mapping == expected
+
+
+def test_small_batches_do_not_load_numpy():
+    # numpy is only needed for the batched cdist path
+    code = ("import sys; from name_matching import match_team_names; "
+            "match_team_names(['Team A', 'team a', 'Rover B', 'Rover  B']); "
+            "print('numpy' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from newscraper import iter_text_lines, read_table, scan_tables, stream_table
+
+CELLS = ["Team A", "team b", " Rover ", "", "12", "3.5", "-1", "x", "1e3", "nan", "7_0", "٣"]
+HEADERS = ["Team name", "Score", "team name", "Sum", "Comment", ""]
+
+
+def random_document(rng):
+    lines = []
+    for _ in range(rng.randint(0, 6)):
+        kind = rng.random()
+        if kind < 0.15:
+            lines.append(rng.choice(["", "   ", "# Results", "Jury notes follow.", "## Final"]))
+            continue
+        header = [rng.choice(HEADERS) for _ in range(rng.randint(0, 3))]
+        if rng.random() < 0.6:
+            header += ["Team name", "Score"]
+            rng.shuffle(header)
+        header = header or ["Team name"]
+        width = len(header)
+        lines.append("| " + " | ".join(header) + " |")
+        if rng.random() < 0.8:
+            lines.append("|" + "|".join(rng.choice(["---", ":---:", "-"]) for _ in range(width)) + "|")
+        for _ in range(rng.randint(0, 5)):
+            if rng.random() < 0.1:
+                lines.append("")
+            cells = [rng.choice(CELLS) for _ in range(width + rng.choice([-1, 0, 0, 0, 1]))]
+            lines.append("|" + "|".join(cells) + "|")
+        if rng.random() < 0.5:
+            lines.append(rng.choice(["", "Some prose.", "# Other"]))
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_stream_table_matches_the_document_parser(seed):
+    rng = random.Random(seed)
+    md_text = random_document(rng)
+    for team_col, score_col in (("Team name", "Score"), ("Team name", "Sum"), ("team name", "Score")):
+        expected = read_table(scan_tables(iter_text_lines(md_text)), team_col, score_col)
+        assert stream_table(iter_text_lines(md_text), team_col, score_col) == expected
+        encoded = (line.encode() for line in md_text.split("\n"))
+        assert stream_table(encoded, team_col, score_col) == expected
+
+
+def test_stream_table_stops_at_the_end_of_its_table():
+    lines = iter(["# Results", "| Team name | Score |", "|---|---|", "| A | 3 |", "", "| B | x |",
+                  "Jury notes follow.", "| Judge | Note |", "| J | n |"])
+    assert stream_table(lines, "Team name", "Score") == (["A", "B"], [3, 0])
+    assert list(lines) == ["| Judge | Note |", "| J | n |"]
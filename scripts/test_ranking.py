@@ -0,0 +1,190 @@
+import random
+import time
+
+import pytest
+
+from board import Board
+from ranking import REBUILD_SHARE, Ranking
+from render import LivePage, render_rows
+
+
+def make_board(scores, columns):
+    teams = sorted(scores)
+    return Board(teams, columns, [[scores[team][j] for team in teams] for j in range(len(columns))])
+
+
+def ranked(scores, columns):
+    board = make_board(scores, columns)
+    board.rank()
+    return board
+
+
+def row_tuples(ranking):
+    return [(position, team, tuple(scores), total)
+            for position, team, scores, total in (ranking.row(i) for i in range(len(ranking)))]
+
+
+def assert_same(got, expected):
+    assert got.teams == expected.teams
+    assert list(got.positions) == list(expected.positions)
+    assert list(got.totals) == list(expected.totals)
+    assert [list(col) for col in got.scores] == [list(col) for col in expected.scores]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_update_and_remove_match_a_full_rank(seed):
+    rng = random.Random(seed)
+    columns = [f"R{j}" for j in range(rng.randint(1, 4))]
+    scores = {f"T{i}": [rng.randint(0, 4) for _ in columns] for i in range(rng.randint(0, 12))}
+    ranking = Ranking(make_board(scores, columns))
+    for _ in range(40):
+        before = ranking.to_board()
+        old_rows = row_tuples(ranking)
+        if scores and rng.random() < 0.15:
+            team = rng.choice(sorted(scores))
+            del scores[team]
+            rows, moved = ranking.remove(team)
+        else:
+            team = f"T{rng.randint(0, 15)}"
+            j = rng.randrange(len(columns))
+            value = rng.randint(0, 6)
+            scores.setdefault(team, [0] * len(columns))[j] = value
+            rows, moved = ranking.update(team, columns[j], value)
+
+        expected = ranked(scores, columns)
+        assert_same(ranking.to_board(), expected)
+        assert [ranking.position(team) for team in expected.teams] == list(expected.positions)
+
+        old_positions = dict(zip(before.teams, before.positions))
+        new_positions = dict(zip(expected.teams, expected.positions))
+        expected_moved = sorted(
+            ((name, old_positions.get(name), new_positions.get(name))
+             for name in set(old_positions) | set(new_positions)
+             if old_positions.get(name) != new_positions.get(name)),
+            key=lambda item: (item[2] is None, item[2] or 0, item[0]))
+        assert moved == expected_moved
+
+        new_rows = row_tuples(ranking)
+        for i, row in enumerate(new_rows):
+            if i >= len(old_rows) or old_rows[i] != row:
+                assert i in rows
+        if len(new_rows) != len(old_rows):
+            assert rows.stop == len(new_rows)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_apply_matches_a_full_rank(seed):
+    rng = random.Random(seed)
+    columns = ["A", "B", "C"]
+
+    def random_board():
+        teams = sorted(rng.sample([f"T{i}" for i in range(15)], rng.randint(0, 10)))
+        return Board(teams, columns, [[rng.randint(0, 3) for _ in teams] for _ in columns])
+
+    ranking = Ranking(random_board())
+    for _ in range(10):
+        old_rows = row_tuples(ranking)
+        board = random_board()
+        rows = ranking.apply(board, max_share=None)
+        expected = Board(board.teams, board.columns, board.scores)
+        expected.rank()
+        assert_same(ranking.to_board(), expected)
+        new_rows = row_tuples(ranking)
+        for i, row in enumerate(new_rows):
+            if i >= len(old_rows) or old_rows[i] != row:
+                assert i in rows
+
+
+def test_apply_with_other_columns_asks_for_a_rebuild():
+    ranking = Ranking(Board(["A"], ["R1"], [[1]]))
+    assert ranking.apply(Board(["A"], ["R1", "R2"], [[1], [2]])) is None
+
+
+def test_apply_with_many_changes_asks_for_a_rebuild():
+    ranking = Ranking(Board([f"T{i}" for i in range(100)], ["R1"], [list(range(100))]))
+    assert ranking.apply(Board([f"T{i}" for i in range(100)], ["R1"], [[i + 1 for i in range(100)]])) is None
+    assert ranking.apply(Board([f"T{i}" for i in range(99)], ["R1"], [list(range(99))])) == range(0, 99)
+
+
+def best_time(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        elapsed = fn()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def full_render(board):
+    ranked_board = Board(board.teams, board.columns, board.scores)
+    ranked_board.rank()
+    return render_rows(ranked_board)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("teams", [2000, 5000])
+def test_round_publish_costs_about_a_full_rank(teams):
+    # A round (re)published in watch mode changes a score of nearly every team
+    rng = random.Random(teams)
+    columns = ["R1", "R2", "R3"]
+    scores = {f"Team {i}": [rng.randint(0, 100), rng.randint(0, 100), 0] for i in range(teams)}
+    published = {team: row[:2] + [rng.randint(0, 100)] for team, row in scores.items()}
+    before, after = make_board(scores, columns), make_board(published, columns)
+
+    def publish():
+        live = LivePage()
+        live.update(before)
+        return timed(live.update, after)
+
+    live = LivePage()
+    live.update(before)
+    assert live.update(after)[1] == full_render(after)
+    assert best_time(publish) < 3 * best_time(lambda: timed(full_render, after)) + 0.01
+
+
+def test_one_change_does_not_walk_every_cell():
+    rng = random.Random(0)
+    columns = [f"R{j}" for j in range(8)]
+    scores = {f"Team {i}": [rng.randint(0, 100) for _ in columns] for i in range(5000)}
+    board = make_board(scores, columns)
+    live = LivePage()
+    live.update(board)
+    # The bottom team jumps to the top
+    bottom = min(scores, key=lambda team: (sum(scores[team]), team))
+    scores[bottom] = [1000] * len(columns)
+    changed = make_board(scores, columns)
+    ranking = Ranking(board)
+    rows = ranking.apply(changed)
+    assert rows == range(0, len(board))
+    assert len(rows) > len(board) * REBUILD_SHARE
+    ranked_board, html = live.update(changed)
+    assert html == full_render(changed)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_live_page_rows_match_a_full_render(seed):
+    rng = random.Random(seed)
+    columns = ["R1", "R2", "R3"]
+    scores = {f"T{i}": [rng.randint(0, 20) for _ in columns] for i in range(40)}
+    live = LivePage()
+    for step in range(60):
+        scores = dict(scores)
+        for _ in range(rng.randint(0, 4)):
+            op = rng.random()
+            team = rng.choice(sorted(scores)) if scores else None
+            if op < 0.15 and team:
+                del scores[team]
+            elif op < 0.3:
+                scores[f"N{step}_{rng.randint(0, 99)}"] = [rng.randint(0, 20) for _ in columns]
+            elif team:
+                changed = list(scores[team])
+                changed[rng.randrange(len(columns))] = rng.randint(0, 20)
+                scores[team] = changed
+        board, rows = live.update(make_board(scores, columns))
+        expected = ranked(scores, columns)
+        assert list(rows) == render_rows(expected)
+        assert_same(board, expected)
@@ -0,0 +1,66 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from board import Board
+from render import render_leaderboard
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+GENERATED_AT = datetime(2025, 6, 1, 12, 30, 45, tzinfo=timezone.utc)
+COLUMNS = ["Qualification", "Connectivity Test", "Round 3", "Jury Points"]
+# Ties, zero cells, an all-zero column and markup in a name
+SCORES = {
+    "AGH Space Systems": [88, 40, 0, 12],
+    "Impuls": [75, 53, 0, 12],
+    "Legendary Rover Team": [75, 53, 0, 12],
+    "MIT Rover": [90, 0, 0, 5],
+    "Team & Co <b>": [10, 0, 0, 0],
+    "Łódź Robotics": [60, 30, 0, 0],
+    "IITB Mars Rover Team": [95, 45, 0, 30],
+    "Ares": [0, 0, 0, 0],
+    "Bit Rover": [50, 40, 0, 0],
+    "KN Robocik": [90, 0, 0, 5],
+    "UKR Team": [33, 12, 0, 7],
+    "Warsaw Polytechnic": [1, 2, 0, 3],
+}
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def table_rows(html):
+    body = html.split('<tbody class="divide-y divide-slate-700">', 1)[1].split("</tbody>", 1)[0]
+    return [row.strip() for row in body.split("</tr>") if row.strip()]
+
+
+def written(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def board():
+    teams = list(SCORES)
+    return Board(teams, COLUMNS, [[SCORES[team][j] for team in teams] for j in range(len(COLUMNS))]).rank()
+
+
+def test_page_matches_the_original_renderer(board, tmp_path):
+    # fixtures/leaderboard.html is what the original f-string generate_leaderboard wrote for this board
+    output_path = str(tmp_path / "index.html")
+    assert render_leaderboard(board, output_path, generated_at=GENERATED_AT) == [output_path]
+    assert written(output_path) == fixture("leaderboard.html")
+
+
+def test_pages_match_the_stored_pager_output(board, tmp_path):
+    output_path = str(tmp_path / "index.html")
+    paths = render_leaderboard(board, output_path, page_size=5, generated_at=GENERATED_AT)
+    assert [os.path.basename(path) for path in paths] == ["index.html", "index-2.html", "index-3.html"]
+    for page, path in enumerate(paths, 1):
+        assert written(path) == fixture(f"leaderboard-page-{page}.html")
+    # Together the pages hold exactly the rows of the original single page
+    rows = [row for path in paths for row in table_rows(written(path))]
+    assert rows == table_rows(fixture("leaderboard.html"))
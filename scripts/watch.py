@@ -0,0 +1,66 @@
+import logging
+import random
+import time
+
+from fetch_cache import content_hash
+from newscraper import fetch_round_sources, make_session
+
+logger = logging.getLogger(__name__)
+
+
+def poll_sources(rounds_config, cache=None, session=None):
+    """
+    Fetch every round once and fingerprint it.
+    With a FetchCache an unchanged source costs a single 304.
+    Returns (sources, digests); digests hold None for rounds that failed.
+    """
+    sources = fetch_round_sources(rounds_config, cache=cache, session=session)
+    digests = [content_hash(md_text) if md_text is not None else None for md_text, _ in sources]
+    return sources, digests
+
+
+def watch(rounds_config, rebuild, interval=30.0, max_backoff=600.0, jitter=0.1, cache=None, max_polls=None,
+          sleep=time.sleep):
+    """
+    Poll the round sources forever and call rebuild(sources) only when one changed.
+
+    interval: seconds between polls, randomized by +/- jitter so many
+              watchers do not hit upstream in lockstep
+    max_backoff: polls where every source fails back off exponentially up to this
+    max_polls: stop after this many polls (for tests)
+    """
+    session = make_session()
+    previous = None
+    delay = interval
+    polls = 0
+    try:
+        while max_polls is None or polls < max_polls:
+            polls += 1
+            started = time.monotonic()
+            try:
+                sources, digests = poll_sources(rounds_config, cache=cache, session=session)
+
+                if all(digest is None for digest in digests):
+                    delay = min(delay * 2, max_backoff)
+                    logger.warning("Every source failed, backing off to %.0fs", delay)
+                else:
+                    if digests != previous:
+                        changed = len(digests) if previous is None else sum(a != b for a, b in zip(digests, previous))
+                        logger.info("%d source(s) changed, rebuilding", changed)
+                        rebuild(sources)
+                        previous = digests
+                    else:
+                        logger.info("No changes (%.2fs poll)", time.monotonic() - started)
+                    delay = interval
+            except Exception:
+                # A failed poll or rebuild must not end the watch; previous stays
+                # as it was, so the next poll sees the change again and retries
+                delay = min(delay * 2, max_backoff)
+                logger.exception("Poll failed, retrying in %.0fs", delay)
+
+            if max_polls is None or polls < max_polls:
+                sleep(delay * random.uniform(1 - jitter, 1 + jitter))
+    except KeyboardInterrupt:
+        logger.info("Watch stopped")
+    finally:
+        session.close()